@@ -1,22 +1,51 @@
-import asyncio
-from typing import List, Optional
+import sys
+from functools import lru_cache
+from typing import List, Optional, TYPE_CHECKING
 import typer
 
-from config.config_manager import ConfigManager, ConfigError
-from parsers.parser_factory import ParserFactory
-from utils.scraper_generator import generate_scraper as _generate_scraper_template
-import parsers.implementations  # noqa: F401
-from core.exceptions import UnknownParserError
-from core.base_scraper import BaseScraper
+if TYPE_CHECKING:
+    from config.config_manager import ConfigManager
+    from core.base_scraper import BaseScraper
+    from parsers.parser_factory import ParserFactory
+
+_COMMANDS = frozenset({"list-parsers", "generate-scraper", "scrape"})
+# Only the invoked subcommand gets registered; --help / unknown input registers all of them
+_INVOKED_COMMAND = sys.argv[1] if len(sys.argv) > 1 and sys.argv[1] in _COMMANDS else None
 
 app = typer.Typer(help="Web Scraper with configurable settings")
 
 
+@app.callback()
+def _main() -> None:
+    # Keeps the app a command group even when a single subcommand is registered
+    pass
+
+
+def _command(name: str):
+    """Registers the decorated function as a subcommand only if it can be invoked in this run."""
+    def decorator(func):
+        if _INVOKED_COMMAND is None or _INVOKED_COMMAND == name:
+            return app.command(name)(func)
+        return func
+    return decorator
+
+
+@lru_cache(maxsize=None)
+def _load_parser_factory() -> "type[ParserFactory]":
+    """Imports the parser factory and registers all parser implementations (once)."""
+    from parsers.parser_factory import ParserFactory
+    import parsers.implementations  # noqa: F401
+
+    return ParserFactory
+
+
 def _get_urls_from_file(file_path: str) -> List[str]:
     """Reads URLs from a file, one per line."""
     try:
         with open(file_path, "r", encoding="utf-8") as f:
-            return [line.strip() for line in f if line.strip()]
+            data = f.read()
+        # One C-level split, each line stripped once
+        return [url for url in map(str.strip, data.splitlines()) if url]
     except FileNotFoundError:
         typer.echo(f"Error: URLs file not found at '{file_path}'", err=True)
         raise typer.Exit(1)
@@ -25,7 +54,7 @@ def _get_urls_from_file(file_path: str) -> List[str]:
         raise typer.Exit(1)
 
 def _gather_urls(urls: Optional[List[str]], urls_file: Optional[str]) -> List[str]:
-    """Collects URLs from commandline arguments and/or a file."""
+    """Collects unique URLs from commandline arguments and/or a file."""
     gathered_urls: List[str] = []
     if urls:
         gathered_urls.extend(urls)
@@ -34,14 +63,21 @@ def _gather_urls(urls: Optional[List[str]], urls_file: Optional[str]) -> List[st
     if not gathered_urls:
         typer.echo("Error: No URLs provided. Use --urls or --urls-file.", err=True)
         raise typer.Exit(1)
-    return gathered_urls
+    # Drop repeated URLs, keeping first-seen order for deterministic crawling
+    unique_urls = list(dict.fromkeys(gathered_urls))
+    duplicates_count = len(gathered_urls) - len(unique_urls)
+    if duplicates_count:
+        typer.echo(f"Skipped {duplicates_count} duplicate URLs.")
+    return unique_urls
 
 def _configure_scraper(
     parser_name: str,
     output_type_cli: Optional[str],
     concurrency_cli: Optional[int]
-) -> ConfigManager:
+) -> "ConfigManager":
     """Initializes and configures the ConfigManager based on parser name and CLI args."""
+    from config.config_manager import ConfigManager, ConfigError
+
     try:
         cfg = ConfigManager(shop_name=parser_name)
 
@@ -61,10 +97,12 @@ def _configure_scraper(
         typer.echo(f"Unexpected error during configuration: {e}", err=True)
         raise typer.Exit(1)
 
-def _initialize_scraper(parser_name: str, cfg: ConfigManager) -> BaseScraper:
+def _initialize_scraper(parser_name: str, cfg: "ConfigManager") -> "BaseScraper":
     """Initializes the scraper using the factory."""
+    from core.exceptions import UnknownParserError
+
     try:
-        scraper = ParserFactory.get_parser(parser_name, cfg)
+        scraper = _load_parser_factory().get_parser(parser_name, cfg)
         return scraper
     except UnknownParserError as exc:
         typer.echo(f"Unknown parser error: {exc}", err=True)
@@ -73,8 +111,10 @@ def _initialize_scraper(parser_name: str, cfg: ConfigManager) -> BaseScraper:
         typer.echo(f"An unexpected error occurred during scraper initialization: {e}", err=True)
         raise typer.Exit(1)
 
-async def _run_scrape_process(scraper: BaseScraper, urls: List[str]):
+async def _run_scrape_process(scraper: "BaseScraper", urls: List[str]):
     """Runs the main scraping process and saves results."""
+    from core.exceptions import ConfigError
+
     # Access storage config through scraper.config_manager
     storage_config = scraper.config_manager.config.storage
     output_file = storage_config.output_file
@@ -88,8 +128,7 @@ async def _run_scrape_process(scraper: BaseScraper, urls: List[str]):
             scraper.logger.info(f"Starting scrape process for {len(urls)} URLs.")
             await scraper.scrape_urls(urls)
             scraper.logger.info(f"Scraping finished. Found {len(scraper.results)} potential items.")
-            await scraper.save_results(output_file=output_file)
-            items_saved_count = getattr(scraper.storage, '_items_saved_count', len(scraper.results))
+            items_saved_count = await scraper.save_results(output_file=output_file)
             typer.echo(f"Scraping completed. {items_saved_count} items saved to {output_file}")
             scraper.logger.info(f"Results saved to {output_file}")
     except Exception as e:
@@ -97,10 +136,10 @@ async def _run_scrape_process(scraper: BaseScraper, urls: List[str]):
         typer.echo(f"An unexpected error occurred during scraping execution: {e}", err=True)
 
 
-@app.command()
+@_command("list-parsers")
 def list_parsers() -> None:
     """Prints available parsers and their descriptions."""
-    parsers = ParserFactory.list_parsers()
+    parsers = _load_parser_factory().list_parsers()
     if not parsers:
         typer.echo("No parsers available.")
         return
@@ -108,12 +147,14 @@ def list_parsers() -> None:
     for name, descr in parsers.items():
         typer.echo(f"- {name}: {descr}")
 
-@app.command()
+@_command("generate-scraper")
 def generate_scraper(
     shop_name: str = typer.Option(..., help="Shop name in snake_case (e.g., my_shop)"),
     description: str = typer.Option(..., help="Human-readable description (e.g., 'Scraper for My Shop')"),
 ):
     """Generates a new scraper template file and configuration."""
+    from utils.scraper_generator import generate_scraper as _generate_scraper_template
+
     try:
         _generate_scraper_template(shop_name, description)
         typer.echo(f"Scraper template '{shop_name}' successfully generated.")
@@ -121,15 +162,17 @@ def generate_scraper(
         typer.echo(f"Error generating scraper template: {e}", err=True)
         raise typer.Exit(1)
 
-@app.command()
+@_command("scrape")
 def scrape(
     parser: str = typer.Option(..., "--parser", "-p", help="Parser name to use (see list-parsers)"),
     urls: Optional[List[str]] = typer.Option(None, "--urls", "-u", help="Direct URLs to scrape (repeatable)"),
     urls_file: Optional[str] = typer.Option(None, "--urls-file", "-f", help="File containing URLs (one per line)"),
-    output_type: Optional[str] = typer.Option(None, "--output-type", "-t", help="Force storage type (csv or json)"),
+    output_type: Optional[str] = typer.Option(None, "--output-type", "-t", help="Force storage type (csv, json or ndjson)"),
     concurrency: Optional[int] = typer.Option(None, "--concurrency", help="Concurrency limit override"),
 ):
     """Runs the specified scraper for the given URLs."""
+    import asyncio
+
     try:
         # 1. Configure Scraper
         cfg = _configure_scraper(parser, output_type, concurrency)
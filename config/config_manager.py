@@ -1,33 +1,102 @@
 import os
+import sys
+import mmap
+import warnings
 import yaml
-from typing import Dict, List, Optional, Any, Type
-from copy import deepcopy
-import datetime
+from functools import lru_cache
+from typing import Annotated, Dict, List, Optional, Any, Tuple, Type
 from core.exceptions import ConfigError
-from pydantic import ValidationError, BaseModel
-import warnings
-from .config_models import ScraperConfig
-
-
+from pydantic import ValidationError, BaseModel, TypeAdapter
+from .config_models import ScraperConfig, ScraperConfigFromEnv
+
+try:  # libyaml-backed loader is much faster, same safety semantics
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Defaults (with SCRAPER_* env overrides) are dumped once per process;
+# validation itself uses the plain ScraperConfig model and never rescans os.environ
+_DEFAULT_CONFIG_DICT: Dict[str, Any] = ScraperConfigFromEnv().model_dump()
+_DEFAULT_SCRAPER_CONFIG: ScraperConfig = ScraperConfig.model_validate(_DEFAULT_CONFIG_DICT)
+
+_VALID_STORAGE_TYPES = frozenset({"csv", "json", "ndjson"})
+
+# Validates a CLI concurrency override against the ScraperConfig field (type and constraints)
+_CONCURRENCY_ADAPTER: TypeAdapter = TypeAdapter(
+    Annotated[ScraperConfig.model_fields["concurrency"].annotation, ScraperConfig.model_fields["concurrency"]]
+)
+
+
+@lru_cache(maxsize=32)
+def _read_yaml_cached(path: str, mtime_ns: int, size: int) -> Optional[Dict[str, Any]]:
+    """Parse YAML file; *mtime_ns* and *size* key the cache so edited files are re-read."""
+    try:
+        with open(path, "rb") as f:
+            if size == 0:
+                return None  # mmap refuses empty files; empty YAML is None anyway
+            # Let libyaml read straight from the page cache instead of a decoded str copy
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return yaml.load(mm, Loader=_YamlLoader)
+    except FileNotFoundError:
+        return None
+    except (yaml.YAMLError, IOError) as e:
+        raise ConfigError(f"Error reading YAML file {path}: {e}") from e
+
+
+def _fast_copy(value: Any) -> Any:
+    """Copy JSON-like containers (dict/list/tuple); scalars are returned as is."""
+    if isinstance(value, dict):
+        return {k: _fast_copy(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_fast_copy(v) for v in value]
+    if isinstance(value, tuple):
+        return tuple(_fast_copy(v) for v in value)
+    return value
+
+
+def _merge_into(target: Dict[str, Any], upd: Dict[str, Any]) -> None:
+    """Recursively merge *upd* into *target* in place."""
+    for k, v in upd.items():
+        current = target.get(k)
+        if isinstance(current, dict) and isinstance(v, dict):
+            _merge_into(current, v)
+        else:
+            target[k] = _fast_copy(v)
 
 
 def _deep_update(base: Dict[str, Any], upd: Dict[str, Any]) -> Dict[str, Any]:
     """Recursively merge *upd* dict into *base* dict and return new copy."""
-    result = deepcopy(base)
-    for k, v in upd.items():
-        if (
-            k in result
-            and isinstance(result[k], dict)
-            and isinstance(v, dict)
-        ):
-            result[k] = _deep_update(result[k], v)
-        else:
-            result[k] = deepcopy(v)
+    result = _fast_copy(base)
+    _merge_into(result, upd)
     return result
 
 
+def _config_path(config_dir: str, filename: str) -> str:
+    """Join *filename* (relative) onto *config_dir* without os.path.join's generic normalization."""
+    if not config_dir:
+        return filename
+    return f"{config_dir.rstrip(os.sep)}{os.sep}{filename}"
+
+
+_HttpClient = None
+
+
+def _get_http_client_cls():
+    """Resolve *HttpClient* class on first use and keep it for later calls."""
+    global _HttpClient
+    if _HttpClient is None:
+        # Lazy import to avoid heavy dependency at import time and prevent cycles
+        from infrastructure.http.client import HttpClient
+        _HttpClient = HttpClient
+    return _HttpClient
+
+
 class ConfigManager:
-    """Loads parser-specific YAML overrides, merges with ScraperConfig defaults, validates."""
+    """Loads parser-specific YAML overrides, merges with ScraperConfig defaults, validates.
+
+    ``config`` must not be mutated in place: change it through ``update_config`` (or
+    ``finalize_runtime_settings``), which also invalidates the parser config cache.
+    """
 
     def __init__(self, shop_name: str, config_dir: str = "config"):
         """Initializes ConfigManager with new loading logic.
@@ -39,10 +108,13 @@ class ConfigManager:
         self.shop_name = shop_name
         self.config_dir = config_dir
         # Path to the consolidated configuration file
-        self.parsers_config_path = os.path.join(config_dir, "parsers_config.yaml")
+        self.parsers_config_path = _config_path(config_dir, "parsers_config.yaml")
         
         self._raw_parser_config_yaml: Dict[str, Any] = self._load_raw_parser_config_from_yaml()
         self.config: ScraperConfig = self._create_final_scraper_config(self._raw_parser_config_yaml)
+        # Validated parser-specific models keyed by (model class, id of the config they were
+        # built from); also cleared whenever self.config is replaced so ids cannot be reused
+        self._parser_config_cache: Dict[Tuple[Type[BaseModel], int], BaseModel] = {}
 
 
     def update_config(self, **kwargs) -> None:
@@ -51,60 +123,70 @@ class ConfigManager:
         updated_dict = _deep_update(current_config_dict, kwargs)
         try:
             self.config = ScraperConfig.model_validate(updated_dict)
+            self._parser_config_cache.clear()
         except ValidationError as e:
              raise ValueError(f"Configuration validation error during update: {e}") from e
 
-
     def finalize_runtime_settings(
         self,
         output_type_cli: Optional[str] = None,
         concurrency_cli: Optional[int] = None,
     ) -> None:
         """Applies CLI overrides, generates default filenames/log paths, and validates."""
-        current_date = datetime.datetime.now().strftime("%Y-%m-%d")
+        import datetime  # deferred, only needed once per run
+
+        current_date = datetime.date.today().isoformat()
         parser_name = self.shop_name
 
         # Determine storage type: CLI > config > default ('csv')
         storage_type_from_config = self.config.storage.type
         final_storage_type = output_type_cli or storage_type_from_config # Default is already in ScraperConfig
 
-        if final_storage_type not in ["csv", "json"]:
-            raise ValueError(f"Invalid output_type: '{final_storage_type}'. Must be 'csv' or 'json'.")
+        if final_storage_type not in _VALID_STORAGE_TYPES:
+            raise ValueError(f"Invalid output_type: '{final_storage_type}'. Must be 'csv', 'json' or 'ndjson'.")
 
         # Generate filename - use shop_name, date, and final type
         output_filename = f"{parser_name}_{current_date}.{final_storage_type}"
         # Generate log filename
         log_filename = f"{parser_name}_{current_date}.log"
 
-        # Prepare updates dictionary
-        updates: Dict[str, Any] = {
+        # Values below are already known to be valid, so copy instead of dump/merge/validate
+        update: Dict[str, Any] = {
             "log_file": log_filename,
             # Update storage with potentially new type and the generated filename
-            "storage": {"type": final_storage_type, "output_file": output_filename}
+            "storage": self.config.storage.model_copy(
+                update={"type": final_storage_type, "output_file": output_filename}
+            ),
         }
-        # Optional overrides from CLI
+        # Optional overrides from CLI - the only user input left to validate
         if concurrency_cli is not None: # Check for None explicitly as 0 could be valid
-            updates["concurrency"] = concurrency_cli
+            try:
+                update["concurrency"] = _CONCURRENCY_ADAPTER.validate_python(concurrency_cli)
+            except ValidationError as e:
+                raise ValueError(f"Configuration finalization error: {e}") from e
+        new_config = self.config.model_copy(update=update)
 
-        try:
-            self.update_config(**updates)
-        except ValueError as e:
-            raise ValueError(f"Configuration finalization error: {e}")
+        self.config = new_config
+        self._parser_config_cache.clear()
 
 
     # DI
     def create_http_client(self):  # noqa: D401 – simple factory
         """Return preconfigured *HttpClient* instance for current shop config."""
-        # Lazy import to avoid heavy dependency at import time
-        from infrastructure.http.client import HttpClient  # local import to prevent cycles
-
-        return HttpClient(self)
+        return _get_http_client_cls()(self)
 
     def create_http_clients(self, count: int | None = None):
-        """Create `count` separate *HttpClient* instances (default sessions_count)."""
+        """Create `count` separate *HttpClient* instances (default sessions_count).
+
+        All clients share one rate limiter, so *delay* applies to the pool as a whole.
+        """
         if count is None:
             count = self.config.sessions_count
-        return [self.create_http_client() for _ in range(count)]
+        from infrastructure.http.rate_limiter import TokenBucket  # local import
+
+        http_client_cls = _get_http_client_cls()
+        rate_limiter = TokenBucket.from_delay(self.config.delay)
+        return [http_client_cls(self, rate_limiter=rate_limiter) for _ in range(count)]
 
     def create_storage(self):  # noqa: D401 – simple factory
         """Instantiate storage backend according to current *storage.type* option."""
@@ -112,13 +194,15 @@ class ConfigManager:
 
         storage_type = self.config.storage.type # Get from validated config
         # Ensure concrete storage module is imported so that it registers itself
-        import importlib
+        module_name = f"infrastructure.storage.{storage_type}_storage"
+        if module_name not in sys.modules:
+            import importlib
 
-        try:
-            importlib.import_module(f"infrastructure.storage.{storage_type}_storage")
-        except ModuleNotFoundError:
-            # No concrete module – will raise later in registry.get
-            pass
+            try:
+                importlib.import_module(module_name)
+            except ModuleNotFoundError:
+                # No concrete module – will raise later in registry.get
+                pass
 
         storage_cls = StorageRegistry.get(storage_type)
         return storage_cls()
@@ -144,16 +228,25 @@ class ConfigManager:
         """
         Creates and validates a parser-specific configuration model
         from the main configuration dictionary (self.config).
+        The validated model is cached per model class and config object; every caller
+        gets its own copy, so changing one scraper's parser config does not affect others.
         """
+        cache_key = (parser_config_model, id(self.config))
+        cached = self._parser_config_cache.get(cache_key)
+        if cached is not None:
+            return cached.model_copy()
         try:
             config_dict = self.config.model_dump(mode="python", exclude_none=True)
-            return parser_config_model.model_validate(config_dict)
+            parser_config = parser_config_model.model_validate(config_dict)
         except ValidationError as e:
             raise ConfigError(
                 f"Validation error when creating specific config '{parser_config_model.__name__}' "
                 f"for shop '{self.shop_name}': {e}"
             ) 
-        
+        self._parser_config_cache[cache_key] = parser_config
+        return parser_config.model_copy()
+
+
     def _load_raw_parser_config_from_yaml(self) -> Dict[str, Any]:
         """Loads the parser-specific section for the current shop from parsers_config.yaml."""
         all_parsers_data = self._read_yaml(self.parsers_config_path)
@@ -171,28 +264,29 @@ class ConfigManager:
         if parser_specific_data is None:
             return {}
 
-        return parser_specific_data
+        # Parsed YAML is cached process-wide, hand out a private copy
+        return _fast_copy(parser_specific_data)
 
     def _create_final_scraper_config(self, parser_specific_config: Dict[str, Any]) -> ScraperConfig:
         """Builds the final ScraperConfig from defaults and provided parser-specific YAML config."""
-        # 1. Start with default config from the model
-        default_config = ScraperConfig()
-        default_config_dict = default_config.model_dump()
-
-        # 2. Deep merge overrides into defaults
-        merged_config_dict = _deep_update(default_config_dict, parser_specific_config)
+        if not parser_specific_config:
+            # Nothing to merge - reuse the already validated defaults (copied, proxy list is mutated below)
+            validated_config = _DEFAULT_SCRAPER_CONFIG.model_copy(deep=True)
+        else:
+            # 1. Deep merge overrides into the cached model defaults (_deep_update returns a copy)
+            merged_config_dict = _deep_update(_DEFAULT_CONFIG_DICT, parser_specific_config)
 
-        # 3.Validate the merged configuration dictionary
-        try:
-            validated_config = ScraperConfig.model_validate(merged_config_dict)
-        except ValidationError as e:
-            raise ConfigError(f"Configuration validation failed for parser '{self.shop_name}' using '{self.parsers_config_path}': {e}") from e
+            # 2.Validate the merged configuration dictionary
+            try:
+                validated_config = ScraperConfig.model_validate(merged_config_dict)
+            except ValidationError as e:
+                raise ConfigError(f"Configuration validation failed for parser '{self.shop_name}' using '{self.parsers_config_path}': {e}") from e
 
-        # 4.Handle proxy file loading (after validation)
+        # 3.Handle proxy file loading (after validation)
         if validated_config.proxy and validated_config.proxy.file:
             proxy_file = validated_config.proxy.file
             if not os.path.isabs(proxy_file):
-                proxy_file_path = os.path.join(self.config_dir, proxy_file)
+                proxy_file_path = _config_path(self.config_dir, proxy_file)
             else:
                 proxy_file_path = proxy_file
 
@@ -206,26 +300,30 @@ class ConfigManager:
         return validated_config
 
     def _read_yaml(self, path: str) -> Optional[Dict[str, Any]]:
-        """Safely read YAML file content."""
+        """Safely read YAML file content (parsed once per file version).
+
+        The returned data is shared between ConfigManager instances, do not mutate it.
+        """
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                return yaml.safe_load(f)
+            st = os.stat(path)
         except FileNotFoundError:
             # File not found is handled upstream in _load_parser_overrides
             return None
-        except (yaml.YAMLError, IOError) as e:
-            raise ConfigError(f"Error reading YAML file {path}: {e}") from e
+        return _read_yaml_cached(path, st.st_mtime_ns, st.st_size)
 
     @staticmethod
     def _load_proxies_from_file(file_path: str) -> List[str]:
         """Load proxies from plain-text file, ignoring commented/empty lines."""
         proxies: List[str] = []
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith("#"):
-                        proxies.append(line)
+            with open(file_path, "rb") as f:
+                data = f.read()
+            # Single C-level split; only kept lines are decoded
+            proxies = [
+                line.decode("utf-8")
+                for line in (raw.strip() for raw in data.splitlines())
+                if line and not line.startswith(b"#")
+            ]
         except Exception as exc: 
             warnings.warn(f"Error loading proxies from file {file_path}: {exc}", UserWarning)
         return proxies
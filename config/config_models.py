@@ -2,12 +2,14 @@ from typing import List, Optional
 from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings
 
+_DEFAULT_RETRY_STATUS_CODES = (408, 429, 500, 502, 503, 504)
+
 class RetryConfig(BaseModel):
     count: int = Field(default=3, ge=1)
     delay: float = Field(default=1.0, ge=0)
     backoff_factor: float = Field(default=2.0, ge=1)
     max_delay: float = Field(default=30.0, ge=0)
-    status_codes: List[int] = Field(default_factory=lambda: [408, 429, 500, 502, 503, 504])
+    status_codes: List[int] = Field(default_factory=lambda: list(_DEFAULT_RETRY_STATUS_CODES))
 
 
 class ProxyConfig(BaseModel):
@@ -38,7 +40,7 @@ class DeduplicationConfig(BaseModel):
     primary_keys: List[str] = Field(default_factory=lambda: ["url", "sku"])
 
 
-class ScraperConfig(BaseSettings):
+class ScraperConfig(BaseModel):
     concurrency: int = Field(default=1, ge=1)
     sessions_count: int = Field(default=1, ge=1)
     delay: float = Field(default=1.0, ge=0)
@@ -57,6 +59,16 @@ class ScraperConfig(BaseSettings):
     max_requests_per_proxy: Optional[int] = Field(default=None)
     use_proxy: bool = Field(default=False)
     deduplication: DeduplicationConfig = Field(default_factory=DeduplicationConfig)
+    # Skip pydantic validation of items produced by the parser's own code
+    trust_parser: bool = Field(default=False)
+
+    model_config = {
+        "extra": "allow",
+    }
+
+
+class ScraperConfigFromEnv(ScraperConfig, BaseSettings):
+    """ScraperConfig with ``SCRAPER_*`` environment overrides (scans os.environ on init)."""
 
     model_config = {
         "extra": "allow",
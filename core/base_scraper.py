@@ -1,19 +1,60 @@
 import asyncio
+import datetime
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import List, Dict, Any, Optional, Set, Callable, TypeVar, Type
-import itertools
-from contextlib import asynccontextmanager
 
-from pydantic import BaseModel
+import orjson
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from config.config_manager import ConfigManager
+from core.data_models import ProductItem, PRODUCT_ITEM_ADAPTER, PRODUCT_ITEM_FIELDS
 from infrastructure.http_client import HttpClient
 from infrastructure.storage.base_storage import BaseStorage
 from utils.logger_factory import get_scraper_logger
 
 T = TypeVar('T')
 
+
+@lru_cache(maxsize=None)
+def _type_adapter(model_type: Any) -> TypeAdapter:
+    """Build (once per type) the adapter used by ``BaseScraper.get_page_json``."""
+    return TypeAdapter(model_type)
+
+
+class ThreadedParserMixin(ABC):
+    """Implements ``parse_page`` by running ``parse_page_sync`` in a worker thread.
+
+    List it before ``BaseScraper`` in the bases: ``class MyScraper(ThreadedParserMixin, BaseScraper)``.
+    """
+    __slots__ = ()
+
+    async def parse_page(self, html_content: str, url: str) -> List[Dict[str, Any]]:
+        """Parse given HTML page in a worker thread via ``parse_page_sync``."""
+        return await asyncio.to_thread(self.parse_page_sync, html_content, url)
+
+    @abstractmethod
+    def parse_page_sync(self, html_content: str, url: str) -> List[Dict[str, Any]]:
+        """Synchronous, CPU-pure page parser (no I/O, no shared state mutation)."""
+        pass
+
+
 class BaseScraper(ABC):
+    # Instance attributes live in slots. A subclass without __slots__ gets a regular
+    # __dict__ and may set any attribute; a subclass that declares __slots__ (as the
+    # bundled parsers do) must list every attribute it adds, or assigning it fails
+    __slots__ = (
+        "shop_name",
+        "config_manager",
+        "http_clients",
+        "_client_index",
+        "storage",
+        "results",
+        "logger",
+        "_processed_urls",
+        "config",
+    )
+
     config: BaseModel
 
     @property
@@ -49,8 +90,8 @@ class BaseScraper(ABC):
         else:
             self.http_clients = [http_client]
 
-        # Create iterator only if clients were already passed to the constructor
-        self._client_cycle = None
+        # Round-robin position in self.http_clients
+        self._client_index = 0
         
         # Storage – inject or create via config manager
         self.storage = storage or self.config_manager.create_storage()
@@ -58,15 +99,14 @@ class BaseScraper(ABC):
         self.logger = get_scraper_logger(shop_name, self.config_manager)
         
         # New attributes for asynchronous work
-        self._client_lock = asyncio.Lock()
-        self._results_lock = asyncio.Lock()
-        self._processed_urls: Set[str] = set()  # To track already processed URLs
+        # Hashes of already processed URLs: 64-bit ints are far smaller than the URL strings
+        self._processed_urls: Set[int] = set()
         
         # Call method to initialize additional attributes
         self.initialize_attributes()
         
-        self.logger.info(f"Initialized {self.__class__.__name__} with {self.config_manager.config.concurrency} concurrent tasks")
-        self.logger.info(f"Will use {self.config_manager.config.sessions_count} HTTP sessions")
+        self.logger.info("Initialized %s with %s concurrent tasks", self.__class__.__name__, self.config_manager.config.concurrency)
+        self.logger.info("Will use %s HTTP sessions", self.config_manager.config.sessions_count)
     
     def initialize_attributes(self):
         """Hook for child classes to attach extra attributes AND loads parser-specific config."""
@@ -75,7 +115,7 @@ class BaseScraper(ABC):
             self.config = self.config_manager.get_parser_config(self.parser_config_model)
         except Exception as e: # Catch ConfigError or other Pydantic validation issues
             # Log and re-raise as a ScraperError to be handled by the caller/main app loop
-            self.logger.error(f"Failed to load parser-specific configuration for {self.shop_name}: {e}")
+            self.logger.error("Failed to load parser-specific configuration for %s: %s", self.shop_name, e)
             # It's crucial that an error here stops scraper initialization.
             from core.exceptions import ScraperError # Local import to avoid circular dependency issues at module level
             raise ScraperError(f"Configuration load error for {self.shop_name}: {e}") from e
@@ -93,8 +133,8 @@ class BaseScraper(ABC):
                     self.config_manager.config.sessions_count
                 )
             )
-        # (Re)create round-robin iterator once pool ready
-        self._client_cycle = itertools.cycle(self.http_clients)
+        # Restart round-robin once pool ready
+        self._client_index = 0
 
     async def _close_sessions(self) -> None:
         """Close all HTTP sessions and attached storage (called from ``__aexit__``)."""
@@ -107,7 +147,7 @@ class BaseScraper(ABC):
             await asyncio.gather(*close_tasks)
             
         self.http_clients.clear()
-        self._client_cycle = None
+        self._client_index = 0
         if self.storage:
             await self.storage.close()
         self.logger.info("All sessions closed")
@@ -118,28 +158,15 @@ class BaseScraper(ABC):
         Returns:
             HTTP-client
         """
-        if not self.http_clients or self._client_cycle is None:
+        if not self.http_clients:
             raise RuntimeError(
                 "HTTP clients not initialized. Call initialize_session() first."
             )
             
-        # Use lock for safe operation in asynchronous context
-        async with self._client_lock:
-            return next(self._client_cycle)
-    
-    @asynccontextmanager
-    async def get_client_session(self):
-        """Get an HTTP client from the pool as an async context manager.
-        
-        Usage:
-            async with self.get_client_session() as client:
-                html = await client.get(url)
-        """
-        client = await self.get_http_client()
-        try:
-            yield client
-        finally:
-            pass
+        # No await between read and increment, so no lock is needed in asyncio
+        index = self._client_index
+        self._client_index = index + 1
+        return self.http_clients[index % len(self.http_clients)]
     
     async def get_page_content(self, url: str, use_proxy: Optional[bool] = None, 
                               headers: Optional[Dict[str, str]] = None,
@@ -156,67 +183,116 @@ class BaseScraper(ABC):
             Raw HTML as string, or ``None`` on failure.
         """
         try:
-            async with self.get_client_session() as client:
-                return await client.get(url, use_proxy=use_proxy, headers=headers, timeout=timeout)
+            client = await self.get_http_client()
+            return await client.get(url, use_proxy=use_proxy, headers=headers, timeout=timeout)
+        except Exception as e:
+            self.logger.error("Error getting page content for %s: %s", url, e)
+            return None
+
+    async def get_page_json(self, url: str, model_type: Optional[Any] = None,
+                            use_proxy: Optional[bool] = None,
+                            headers: Optional[Dict[str, str]] = None,
+                            timeout: Optional[int] = None) -> Any:
+        """Download a JSON endpoint.
+
+        Args:
+            url: Absolute endpoint URL.
+            model_type: Optional type (e.g. ``List[ProductItem]``) to validate against;
+                raw bytes are decoded and validated in a single pydantic-core pass.
+            use_proxy: Force proxy usage for this request (overrides global cfg).
+            headers: Optional HTTP headers to send with request
+            timeout: Optional timeout override for this specific request
+
+        Returns:
+            Decoded (and validated) data, or ``None`` on failure.
+        """
+        try:
+            client = await self.get_http_client()
+            data = await client.get(url, use_proxy=use_proxy, headers=headers,
+                                    timeout=timeout, response_type="bytes")
+            if not data:
+                return None
+            if model_type is not None:
+                return _type_adapter(model_type).validate_json(data)
+            return orjson.loads(data)
         except Exception as e:
-            self.logger.error(f"Error getting page content for {url}: {str(e)}")
+            self.logger.error("Error getting JSON for %s: %s", url, e)
             return None
 
     @abstractmethod
     async def parse_page(self, html_content: str, url: str) -> List[Dict[str, Any]]:
-        """Parse given HTML page and return list of product dictionaries."""
+        """Parse given HTML page and return list of product dictionaries.
+
+        Parsers with CPU-only parsing can mix in ``ThreadedParserMixin`` and implement
+        ``parse_page_sync`` instead, so parsing does not block other fetches.
+        """
         pass
     
-    async def transform_item(self, item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """Validate items, apply transformation pipeline and extend ``self.results``."""
-        from core.data_models import ProductItem  # local import to avoid circular dependencies
-        from pydantic import ValidationError
+    def transform_item(self, item: Dict[str, Any], scrape_time: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Validate a single item and return it as a dict (``None`` if invalid).
+
+        Pure CPU work, so it is a plain function rather than a coroutine.
 
+        Args:
+            item: Raw item produced by the parser.
+            scrape_time: Shared timestamp for items of one page (used if the item has none).
+        """
         # ensure mandatory "shop_name" present; prefer original value if already specified
         payload: Dict[str, Any] = {**item}
         payload.setdefault("shop_name", self.shop_name)
+        if scrape_time is not None:
+            payload.setdefault("scrape_time", scrape_time)
+
+        if self.config_manager.config.trust_parser:
+            # Trusted parser output: build the item without validation (defaults are still applied)
+            trusted = {field: payload[field] for field in PRODUCT_ITEM_FIELDS if field in payload}
+            return ProductItem.model_construct(**trusted).__dict__
 
         try:
-            validated = ProductItem.model_validate(payload)
+            validated = PRODUCT_ITEM_ADAPTER.validate_python(payload)
         except ValidationError as exc:
             # Log and skip broken item
             self.logger.warning("Validation error for item %s: %s", item, exc)
             return None
 
-        return validated.model_dump(mode="python")
+        return PRODUCT_ITEM_ADAPTER.dump_python(validated, mode="python")
     
     async def process_items(self, items: List[Dict[str, Any]]) -> None:
         """Validate items, apply transformation pipeline and extend ``self.results``."""
         if not items:
             return
             
-        transform_tasks = [self.transform_item(item) for item in items]
-        transformed_items = await asyncio.gather(*transform_tasks)
-        
-        # Filter None and add to results with lock
-        valid_items = [item for item in transformed_items if item is not None]
+        # Items of one page are effectively simultaneous - take the timestamp once
+        scrape_time = datetime.datetime.now().isoformat()
+        transform = self.transform_item
+        # transform_item does no I/O - run it inline instead of scheduling a task per item
+        valid_items = [
+            result for result in (transform(item, scrape_time) for item in items)
+            if result is not None
+        ]
         
         if valid_items:
-            async with self._results_lock:
-                self.results.extend(valid_items)
-                self.logger.info(f"Added {len(valid_items)} items to results")
+            # No await between the checks and extend, so other coroutines cannot interleave
+            self.results.extend(valid_items)
+            self.logger.info("Added %s items to results", len(valid_items))
 
     async def process_url(self, url: str) -> None:
         """Scrape single URL – fetch, parse, transform and recurse if needed."""
         # Check if we have already processed this URL
-        if url in self._processed_urls:
-            self.logger.debug(f"Skipping already processed URL: {url}")
+        url_hash = hash(url)
+        if url_hash in self._processed_urls:
+            self.logger.debug("Skipping already processed URL: %s", url)
             return
             
         # Add URL to the list of processed ones
-        self._processed_urls.add(url)
+        self._processed_urls.add(url_hash)
         
-        self.logger.info(f"Processing URL: {url}")
+        self.logger.info("Processing URL: %s", url)
         try:
             # Get page content
             content = await self.get_page_content(url)
             if not content:
-                self.logger.error(f"Failed to get content for {url}")
+                self.logger.error("Failed to get content for %s", url)
                 return
                 
             # Parse page and process items
@@ -227,7 +303,7 @@ class BaseScraper(ABC):
             await self.process_pagination(url, content)
             
         except Exception as e:
-            self.logger.error(f"Error processing {url}: {str(e)}")
+            self.logger.error("Error processing %s: %s", url, e)
     
     async def process_pagination(self, url: str, content: str) -> None:
         """Handle pagination – override in subclasses when necessary."""
@@ -259,22 +335,17 @@ class BaseScraper(ABC):
         self.logger.info(f"Starting scraping {len(urls)} URLs with {self.config_manager.config.concurrency} concurrent tasks")
         self.logger.info(f"Using {len(self.http_clients)} HTTP sessions")
         
-        # Use batch processing for large lists of URLs
-        if len(urls) > 50 and hasattr(self.config_manager.config.batch, 'size'):
-            await self.batch_process_urls(urls, self.config_manager.config.batch.size)
-            return
-        
-        # For small lists, use the standard approach with a semaphore
-        concurrency = self.config_manager.config.concurrency
-        semaphore = asyncio.Semaphore(concurrency)
+        # Fixed pool of workers sharing one iterator: a new URL starts as soon as any
+        # worker is free, with no per-batch barrier and one coroutine per worker, not per URL.
+        # next() never awaits, so two workers cannot take the same URL
+        pending_urls = iter(urls)
 
-        async def _runner(single_url: str):
-            async with semaphore:
+        async def _worker():
+            for single_url in pending_urls:
                 await self.process_url(single_url)
 
-        # Start processing URLs asynchronously
-        tasks = [_runner(url) for url in urls]
-        await asyncio.gather(*tasks)
+        workers_count = min(self.config_manager.config.concurrency, len(urls))
+        await asyncio.gather(*[_worker() for _ in range(workers_count)])
         
         self.logger.info(f"Finished scraping. Total items found: {len(self.results)}")
 
@@ -288,23 +359,21 @@ class BaseScraper(ABC):
         if not primary_keys:
             primary_keys = ["url", "article"]
 
-        seen = set()
+        primary_keys = tuple(primary_keys)
+        seen: Set[tuple] = set()
+        seen_add = seen.add
         unique_items = []
 
         for item in items:
-            # Create key based on specified fields
-            key_parts = []
-            for key in primary_keys:
-                key_parts.append(str(item.get(key, "")))
-
-            key = "_".join(key_parts)
+            # Tuples hash natively, no per-item string formatting needed
+            key = tuple(map(item.get, primary_keys))
 
             # If key has been seen, skip item
             if key in seen:
                 continue
 
             # If all checks passed, add item
-            seen.add(key)
+            seen_add(key)
             unique_items.append(item)
 
         removed_count = len(items) - len(unique_items)
@@ -314,8 +383,12 @@ class BaseScraper(ABC):
              self.logger.info(f"Removed {removed_count} duplicate items (0.0%)") # Or handle as appropriate
         return unique_items
 
-    async def save_results(self, output_file: str) -> None:
-        """Persist collected results via configured storage backend."""
+    async def save_results(self, output_file: str) -> int:
+        """Persist collected results via configured storage backend.
+
+        Returns:
+            Number of items written by the storage backend.
+        """
         # Get filtering parameters from configuration, if they exist
         primary_keys = None
 
@@ -338,6 +411,7 @@ class BaseScraper(ABC):
         # Storage is already created in __init__, type can be changed externally if needed
         await self.storage.save(filtered_results, output_file)
         self.logger.info(f"Results saved to {output_file}")
+        return self.storage.items_saved
         
     async def execute_parallel(self, 
                              items: List[T], 
@@ -365,13 +439,11 @@ class BaseScraper(ABC):
                 
         return await asyncio.gather(*[_bounded_worker(item) for item in items])
 
-    def _format_price(self, price: float) -> str:
+    def _format_price(self, price: Optional[float]) -> Optional[str]:
         """Pretty-print price dropping trailing decimals when zero."""
-        if not price:
+        if price is None:
             return None
-        if price == int(price):
-            return str(int(price))
-        return str(price)
+        return str(int(price)) if float(price).is_integer() else str(price)
 
     async def __aenter__(self):
         """Initialize HTTP sessions and return self."""
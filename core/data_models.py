@@ -1,5 +1,5 @@
-from typing import Optional
-from pydantic import BaseModel, Field
+from typing import Optional, Tuple
+from pydantic import BaseModel, Field, TypeAdapter
 import datetime
 
 class ProductItem(BaseModel):
@@ -14,3 +14,10 @@ class ProductItem(BaseModel):
     class Config:
         arbitrary_types_allowed = True
         extra = "ignore"
+
+
+# Field names in declaration order, used to filter trusted payloads without validation
+PRODUCT_ITEM_FIELDS: Tuple[str, ...] = tuple(ProductItem.model_fields)
+
+# Prebuilt adapter: validates/dumps items via pydantic-core without classmethod dispatch per call
+PRODUCT_ITEM_ADAPTER: TypeAdapter[ProductItem] = TypeAdapter(ProductItem)
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
-from typing import Optional, Dict, Any, List, Callable, Tuple, Union, Awaitable, TypeVar, cast
+from typing import Optional, Dict, Any, List, Callable, Union, Awaitable, TypeVar
 
 import aiohttp
+import orjson
 from aiohttp import ClientTimeout, TCPConnector
 
 from config.config_manager import ConfigManager
@@ -13,6 +15,7 @@ from infrastructure.proxy_manager import ProxyManager
 
 from .middlewares import Middleware, LoggingMiddleware, ProxyMiddleware, RetryMiddleware, MetricsMiddleware
 from .http_models import HttpSettings, RetryPolicy
+from .rate_limiter import TokenBucket
 
 T = TypeVar('T')
 
@@ -26,12 +29,14 @@ class HttpClient:
         config_manager: ConfigManager,
         settings: Optional[HttpSettings] = None,
         middlewares: Optional[List[Middleware]] = None,
+        rate_limiter: Optional[TokenBucket] = None,
     ) -> None:
         self.config_manager = config_manager
         self.settings = settings or self._settings_from_global_config()
         self.logger = logging.getLogger(__name__)
         self.session: Optional[aiohttp.ClientSession] = None
-        self.last_request_time: float = 0.0
+        # Pass the same limiter to every client of a pool to enforce the delay globally
+        self.rate_limiter = rate_limiter or TokenBucket.from_delay(self.settings.delay_between_requests)
         
         self.middlewares: List[Middleware] = []
         
@@ -40,19 +45,45 @@ class HttpClient:
 
         self.middlewares.append(RetryMiddleware(self.settings.retry))
 
-        if self.settings.use_proxy or self.config_manager.config.use_proxy:
+        cfg = self.config_manager.config
+        use_proxy = self.settings.use_proxy or cfg.use_proxy
+        if use_proxy:
             proxy_mw = ProxyMiddleware(
                 ProxyManager(
-                    proxy_file=self.config_manager.config.proxy.file,
-                    max_requests_per_proxy=self.config_manager.config.max_requests_per_proxy or 10,
+                    proxy_file=cfg.proxy.file,
+                    max_requests_per_proxy=cfg.max_requests_per_proxy or 10,
                 ),
-                use_proxy_default=self.settings.use_proxy or self.config_manager.config.use_proxy,
+                use_proxy_default=use_proxy,
             )
             self.middlewares.append(proxy_mw)
 
         if middlewares: 
             self.middlewares.extend(middlewares)
 
+        # Built once; per-request headers are merged over a copy only when given
+        self._default_headers: Dict[str, str] = {
+            "User-Agent": cfg.user_agent,
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+            "Accept-Language": "en-US,en;q=0.9",
+        }
+
+        # Middlewares are fixed after construction, so the chain is built only once
+        self._chained = self._build_chain()
+
+        # Session parameters are fixed as well; _ensure_session only has to instantiate
+        self._timeout = ClientTimeout(
+            total=self.settings.timeout,
+            connect=self.settings.connect_timeout,
+        )
+        self._connector_kwargs: Dict[str, Any] = {
+            "limit": self.settings.max_connections,
+            "limit_per_host": self.settings.limit_per_host,
+            "enable_cleanup_closed": True,
+            "keepalive_timeout": self.settings.keepalive_timeout,
+            # Keep pooled (including proxy) connections open between requests
+            "force_close": False,
+        }
+
     # ---------------- public API ----------------
 
     async def __aenter__(self):
@@ -78,7 +109,8 @@ class HttpClient:
         headers: Optional[Dict[str, str]] = None,
         use_proxy: Optional[bool] = None,
         timeout: Optional[int] = None,
-    ) -> Optional[str]:
+        response_type: str = "text",
+    ) -> Optional[Union[str, Dict[str, Any], bytes]]:
         return await self._request(
             "GET",
             url,
@@ -86,9 +118,8 @@ class HttpClient:
             headers=headers,
             use_proxy=use_proxy,
             timeout=timeout,
-            response_type="text",
+            response_type=response_type,
         )
-        return cast(Optional[str], result)
 
     async def post(
         self,
@@ -131,27 +162,21 @@ class HttpClient:
 
     async def _ensure_session(self):
         if self.session is None or self.session.closed:
-            connector = TCPConnector(
-                limit=self.settings.max_connections,
-                limit_per_host=self.settings.limit_per_host,
-                enable_cleanup_closed=True,
-                keepalive_timeout=self.settings.keepalive_timeout,
-            )
+            # Connector is bound to the running loop, so only its arguments are prebuilt
             self.session = aiohttp.ClientSession(
-                connector=connector,
-                timeout=ClientTimeout(
-                    total=self.settings.timeout,
-                    connect=self.settings.connect_timeout,
-                )
+                connector=TCPConnector(**self._connector_kwargs),
+                timeout=self._timeout,
             )
 
     async def _wait_between_requests(self):
-        now = asyncio.get_event_loop().time()
-        since = now - self.last_request_time
-        wait = self.settings.delay_between_requests - since
-        if wait > 0:
-            await asyncio.sleep(wait)
-        self.last_request_time = asyncio.get_event_loop().time()
+        await self.rate_limiter.acquire()
+
+    def _build_chain(self) -> Callable[..., Awaitable[Any]]:
+        """Fold middlewares around ``_single_request`` (first middleware is the outermost)."""
+        handler: Callable[..., Awaitable[Any]] = self._single_request
+        for mw_instance in reversed(self.middlewares):
+            handler = functools.partial(mw_instance, handler)
+        return handler
 
     async def _request(
         self,
@@ -160,17 +185,10 @@ class HttpClient:
         **kwargs,
     ) -> Optional[Union[str, Dict[str, Any], bytes]]:
         
-        async def _fetch(m: str, u: str, **kwds_fetch):
-            return await self._single_request(m, u, **kwds_fetch)
+        # Session is normally opened in __aenter__; checked once here, not per retry
+        if self.session is None or self.session.closed:
+            await self._ensure_session()
 
-        chained_request_handler = _fetch
-        for mw_instance in reversed(self.middlewares):
-            def create_handler_stage(current_mw, next_in_chain):
-                async def stage(method_stage: str, url_stage: str, **kwargs_stage):
-                    return await current_mw(next_in_chain, method_stage, url_stage, **kwargs_stage)
-                return stage
-            chained_request_handler = create_handler_stage(mw_instance, chained_request_handler)
-        
         request_kwargs = kwargs.copy()
         timeout_val = request_kwargs.pop('timeout', None)
 
@@ -180,26 +198,19 @@ class HttpClient:
             else:
                  request_kwargs['timeout'] = timeout_val
         
-        return await chained_request_handler(method, url, **request_kwargs)
+        return await self._chained(method, url, **request_kwargs)
 
     async def _single_request(
         self,
         method: str,
         url: str,
-        response_type: str = "text", # This is passed via kwargs from _request -> _fetch -> _single_request
+        response_type: str = "text", # This is passed via kwargs from _request -> middleware chain -> _single_request
         headers: Optional[Dict[str, str]] = None,
         **kwargs,
     ) -> Optional[Union[str, Dict[str, Any], bytes]]:
-        await self._ensure_session()
         await self._wait_between_requests()
 
-        req_headers = {
-            "User-Agent": self.config_manager.config.user_agent,
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.9",
-        }
-        if headers:
-            req_headers.update(headers)
+        req_headers = {**self._default_headers, **headers} if headers else self._default_headers
         
         final_kwargs = kwargs.copy()
         final_kwargs["headers"] = req_headers
@@ -218,7 +229,9 @@ class HttpClient:
                         headers=resp.headers
                     )
                 if actual_response_type == "json":
-                    return await resp.json()
+                    # Decode raw bytes with orjson, skipping aiohttp's charset detection and str copy
+                    body = await resp.read()
+                    return orjson.loads(body) if body.strip() else None
                 if actual_response_type == "bytes":
                     return await resp.read()
                 return await resp.text()
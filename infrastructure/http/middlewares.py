@@ -1,9 +1,11 @@
 import asyncio
 import logging
 import time
-from typing import Dict, Any, Callable, Awaitable, TypeVar
+from functools import lru_cache
+from typing import Dict, Any, Callable, Awaitable, List, Optional, Tuple, TypeVar
 
 import aiohttp
+from yarl import URL
 
 from infrastructure.proxy_manager import ProxyManager
 from .http_models import RetryPolicy
@@ -11,6 +13,26 @@ from .http_models import RetryPolicy
 
 T = TypeVar('T')
 
+
+@lru_cache(maxsize=4096)
+def _origin_host(origin: str) -> str:
+    try:
+        return URL(origin).host or "unknown_host"
+    except ValueError:
+        return "invalid_url_host"
+
+
+def _url_host(url: str) -> str:
+    """Host of *url* for metrics.
+
+    Only the ``scheme://authority`` prefix is parsed (with an LRU cache), so a crawler
+    that hits a handful of domains almost never builds a URL object per request.
+    """
+    scheme_end = url.find('://')
+    path_start = url.find('/', scheme_end + 3) if scheme_end != -1 else -1
+    return _origin_host(url if path_start == -1 else url[:path_start])
+
+
 class Middleware:
     """Composable middleware: accepts the *next* handler and returns awaited result."""
 
@@ -35,7 +57,16 @@ class LoggingMiddleware(Middleware):
 
 
 class ProxyMiddleware(LoggingMiddleware):
-    """Adds proxy settings to each request when enabled."""
+    """Adds proxy settings to each request when enabled.
+
+    ProxyManager keeps the same proxy for up to ``max_requests_per_proxy``
+    consecutive requests, so connections to it can be reused only if the
+    client's ``TCPConnector`` keeps them alive: ``force_close=False``, a
+    ``keepalive_timeout`` longer than the gap between requests (``http.keepalive_timeout``,
+    e.g. 120 when scraping through proxies) and a generous ``limit_per_host``.
+    Callers that keep one session per proxy can key it by
+    ``ProxyManager.proxy_session_key()``.
+    """
 
     def __init__(self, proxy_manager: ProxyManager, use_proxy_default: bool):
         super().__init__("ProxyMW")
@@ -58,13 +89,10 @@ class ProxyMiddleware(LoggingMiddleware):
             proxy_data = self.proxy_manager.prepare_proxy()
             proxy_data_obtained = proxy_data # Store proxy_data to check later
             if proxy_data:
-                proxy_url = (
-                    f"http://{proxy_data['username']}:{proxy_data['password']}@"
-                    f"{proxy_data['host']}:{proxy_data['port']}"
-                )
-                kwargs["proxy"] = proxy_url
-                # Auth already included in URL; ensure aiohttp does not add another
-                kwargs["proxy_auth"] = None
+                # URL and credentials are prebuilt by ProxyManager when the proxy is parsed;
+                # a credential-free URL keeps aiohttp's connection key a clean host:port
+                kwargs["proxy"] = proxy_data['url']
+                kwargs["proxy_auth"] = proxy_data['auth']
                 proxy_address_for_logging = f"{proxy_data['host']}:{proxy_data['port']}"
                 self.logger.debug("Using proxy %s for URL %s", proxy_address_for_logging, url)
 
@@ -84,6 +112,14 @@ class RetryMiddleware(LoggingMiddleware):
     def __init__(self, policy: 'RetryPolicy') -> None:
         super().__init__("RetryMW")
         self.policy = policy
+        # Policy is immutable for the middleware's lifetime: precompute the backoff
+        # schedule and hoist the retryable statuses/exceptions into C-level containers
+        self._delays = tuple(
+            min(policy.delay * policy.backoff_factor ** i, policy.max_delay)
+            for i in range(policy.retries + 1)
+        )
+        self._status_codes = frozenset(policy.status_codes)
+        self._exc_types = tuple(policy.exceptions)
 
     async def __call__(
         self, 
@@ -94,8 +130,11 @@ class RetryMiddleware(LoggingMiddleware):
     ) -> T:
         attempt = 0
         last_exception = None
+        retries = self.policy.retries
+        status_codes = self._status_codes
+        exc_types = self._exc_types
         
-        while attempt <= self.policy.retries:
+        while attempt <= retries:
             try:
                 response = await handler(method, url, **kwargs)
                 return response
@@ -103,25 +142,20 @@ class RetryMiddleware(LoggingMiddleware):
                 last_exception = exc
                 attempt += 1
                 
-                should_retry = False
-                
-                if isinstance(exc, aiohttp.ClientResponseError) and exc.status in self.policy.status_codes:
-                    should_retry = True
-                elif any(isinstance(exc, ex_type) for ex_type in self.policy.exceptions):
+                if isinstance(exc, aiohttp.ClientResponseError) and exc.status in status_codes:
                     should_retry = True
+                else:
+                    should_retry = isinstance(exc, exc_types)
                 
-                if not should_retry or attempt > self.policy.retries:
+                if not should_retry or attempt > retries:
                     raise
                 
-                wait = min(
-                    self.policy.delay * (self.policy.backoff_factor ** (attempt - 1)),
-                    self.policy.max_delay
-                )
+                wait = self._delays[attempt - 1]
                 
                 self.logger.warning(
                     "Attempt %s/%s failed for %s: %s (retry in %.2fs)",
                     attempt,
-                    self.policy.retries,
+                    retries,
                     url,
                     exc,
                     wait,
@@ -134,11 +168,23 @@ class RetryMiddleware(LoggingMiddleware):
 
 
 class MetricsMiddleware(LoggingMiddleware):
-    """Records request/response metrics."""
+    """Records request/response metrics.
+
+    Requests only append an event to a pending batch; the batch is folded into
+    counters (parallel lists indexed by domain) every ``flush_every`` events and
+    before metrics are read. ``get_metrics`` assembles the per-domain dict view.
+    """
     
-    def __init__(self):
+    def __init__(self, flush_every: int = 256):
         super().__init__("MetricsMW")
-        self.metrics: Dict[str, Dict[str, Any]] = {} # Ensure metrics is typed
+        self.flush_every = flush_every
+        self._pending: List[Tuple[str, bool, int, Optional[str]]] = []
+        self._domain_idx: Dict[str, int] = {}
+        self._count: List[int] = []
+        self._success: List[int] = []
+        self._failure: List[int] = []
+        self._total_time_ns: List[int] = []
+        self._errors: List[Dict[str, int]] = [] # To count specific error types
     
     async def __call__(
         self, 
@@ -147,45 +193,60 @@ class MetricsMiddleware(LoggingMiddleware):
         url: str, 
         **kwargs
     ) -> T:
-        start_time = time.monotonic() # Use monotonic time for duration
-        # Improve domain parsing
-        try:
-            parsed_url = aiohttp.helpers.URL(url)
-            domain = parsed_url.host or "unknown_host"
-        except ValueError:
-            domain = "invalid_url_host"
+        start_ns = time.perf_counter_ns() # Integer nanoseconds, converted to seconds on read
+        domain = _url_host(url)
 
         try:
             result = await handler(method, url, **kwargs)
-            elapsed = time.monotonic() - start_time
-            self._update_domain_metrics(domain, True, elapsed)
+            self._record(domain, True, time.perf_counter_ns() - start_ns, None)
             return result
         except Exception as exc:
-            elapsed = time.monotonic() - start_time
-            self._update_domain_metrics(domain, False, elapsed, exc)
+            self._record(domain, False, time.perf_counter_ns() - start_ns, type(exc).__name__)
             raise
 
-    def _update_domain_metrics(self, domain: str, success: bool, duration: float, exc: Exception | None = None) -> None:
+    def _record(self, domain: str, success: bool, duration_ns: int, error_type: Optional[str]) -> None:
+        pending = self._pending
+        pending.append((domain, success, duration_ns, error_type))
+        if len(pending) >= self.flush_every:
+            self._flush()
+
+    def _flush(self) -> None:
+        """Fold pending events into the counters."""
+        pending, self._pending = self._pending, []
+        for event in pending:
+            self._update_domain_metrics(*event)
+
+    def _update_domain_metrics(self, domain: str, success: bool, duration_ns: int, error_type: Optional[str] = None) -> None:
         """Helper to update metrics for a given domain."""
-        if domain not in self.metrics:
-            self.metrics[domain] = {
-                'count': 0,
-                'success': 0,
-                'failure': 0,
-                'total_time': 0.0,
-                'errors': {} # To count specific error types
-            }
+        idx = self._domain_idx.get(domain)
+        if idx is None:
+            idx = self._domain_idx[domain] = len(self._count)
+            self._count.append(0)
+            self._success.append(0)
+            self._failure.append(0)
+            self._total_time_ns.append(0)
+            self._errors.append({})
         
-        self.metrics[domain]['count'] += 1
-        self.metrics[domain]['total_time'] += duration
+        self._count[idx] += 1
+        self._total_time_ns[idx] += duration_ns
         if success:
-            self.metrics[domain]['success'] += 1
+            self._success[idx] += 1
         else:
-            self.metrics[domain]['failure'] += 1
-            if exc:
-                error_type = type(exc).__name__
-                self.metrics[domain]['errors'][error_type] = self.metrics[domain]['errors'].get(error_type, 0) + 1
+            self._failure[idx] += 1
+            if error_type:
+                errors = self._errors[idx]
+                errors[error_type] = errors.get(error_type, 0) + 1
                 
     def get_metrics(self) -> Dict[str, Dict[str, Any]]:
-        """Returns the collected metrics."""
-        return self.metrics.copy() 
\ No newline at end of file
+        """Returns a snapshot of the collected metrics."""
+        self._flush()
+        return {
+            domain: {
+                'count': self._count[idx],
+                'success': self._success[idx],
+                'failure': self._failure[idx],
+                'total_time': self._total_time_ns[idx] / 1e9,
+                'errors': self._errors[idx].copy(),
+            }
+            for domain, idx in self._domain_idx.items()
+        }
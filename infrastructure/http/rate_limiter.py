@@ -0,0 +1,32 @@
+import asyncio
+import time
+
+
+class TokenBucket:
+    """Rate limiter shared between HTTP clients: *rate* requests/sec, bursts up to *capacity*.
+
+    Each ``acquire`` reserves the next free slot before awaiting, so concurrent
+    callers never need a lock (there is no await between read and update).
+    """
+
+    def __init__(self, rate: float, capacity: int = 1) -> None:
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self.capacity = max(capacity, 1)
+        # Theoretical time at which the next request may start
+        self._next_slot = 0.0
+
+    @classmethod
+    def from_delay(cls, delay: float) -> "TokenBucket":
+        """Create bucket enforcing *delay* seconds between consecutive requests (0 – unlimited)."""
+        return cls(rate=1.0 / delay if delay > 0 else 0.0)
+
+    async def acquire(self) -> None:
+        """Wait until a request is allowed to start."""
+        if self.interval <= 0:
+            return
+        now = time.monotonic()
+        slot = max(self._next_slot, now)
+        self._next_slot = slot + self.interval
+        wait = slot - now - (self.capacity - 1) * self.interval
+        if wait > 0:
+            await asyncio.sleep(wait)
@@ -1,7 +1,20 @@
 import random
 import os
 import logging
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Hashable
+
+from aiohttp import BasicAuth
+
+# Number of errors after which a proxy is taken out of rotation
+_MAX_PROXY_ERRORS = 3
+
+
+def _proxy_key(proxy: Any) -> Hashable:
+    """Cheap hashable identity of a proxy: ``(host, port)`` for parsed entries."""
+    if isinstance(proxy, dict):
+        return (proxy['host'], proxy['port'])
+    return proxy
+
 
 class ProxyManager:
     
@@ -17,13 +30,17 @@ class ProxyManager:
         self.logger = logging.getLogger(__name__)
         self.proxy_list = proxy_list or []
         self.current_proxy = None
+        self._current_index: Optional[int] = None
         self.requests_with_current_proxy = 0
         self.max_requests_per_proxy = max_requests_per_proxy
-        self.proxy_errors = {}  # Error counter for each proxy
+        self.proxy_errors: Dict[Hashable, int] = {}  # Error counter for each proxy, keyed by (host, port)
         
         # Load proxies from file if specified
         if proxy_file and os.path.exists(proxy_file):
             self._load_proxies_from_file(proxy_file)
+
+        # Indices into proxy_list of proxies still in rotation
+        self._active: List[int] = list(range(len(self.proxy_list)))
     
     def _load_proxies_from_file(self, proxy_file: str) -> None:
         """
@@ -40,46 +57,82 @@ class ProxyManager:
                         continue
                     
                     try:
-                        # Format: user:pass@host:port
-                        auth, address = line.split('@')
-                        username, password = auth.split(':')
-                        host, port_str = address.split(':')
-                        
-                        # Convert port to int 
-                        try:
-                            port = int(port_str)
-                        except ValueError:
-                            self.logger.error(f"Invalid port number: {port_str} in proxy: {line}")
-                            continue
-                        
-                        proxy = {
-                            'host': host,
-                            'port': port,
-                            'username': username,
-                            'password': password
-                        }
-                        
-                        self.proxy_list.append(proxy)
+                        proxy = self._parse_proxy(line)
+                    except ValueError as e:
+                        self.logger.error(f"{e} in proxy: {line}")
+                        continue
                     except Exception as e:
                         self.logger.error(f"Invalid proxy format: {line}, error: {str(e)}")
                         continue
+
+                    self.proxy_list.append(proxy)
             
             self.logger.info(f"Loaded {len(self.proxy_list)} proxies from {proxy_file}")
         except Exception as e:
             self.logger.error(f"Error loading proxies from {proxy_file}: {str(e)}")
     
+    @staticmethod
+    def _parse_proxy(line: str) -> Dict[str, Any]:
+        """
+        Parses a ``user:pass@host:port`` proxy line (an optional ``http://`` prefix is allowed)
+
+        The plain proxy URL and its ``BasicAuth`` (base64 header precomputed) are built
+        here once instead of on every request.
+
+        Args:
+            line: Proxy line
+
+        Returns:
+            A dictionary with proxy parameters
+
+        Raises:
+            ValueError: If the port is not a number
+        """
+        line = line.removeprefix('http://')
+        auth, address = line.split('@')
+        username, password = auth.split(':')
+        host, port_str = address.split(':')
+
+        # Convert port to int
+        try:
+            port = int(port_str)
+        except ValueError:
+            raise ValueError(f"Invalid port number: {port_str}") from None
+
+        return {
+            'host': host,
+            'port': port,
+            'username': username,
+            'password': password,
+            'url': f"http://{host}:{port}",
+            'auth': BasicAuth(username, password),
+        }
+
     def get_random_proxy(self) -> Optional[Dict[str, Any]]:
         """
-        Returns a random proxy from the list
+        Returns a random proxy from the active (not banned) pool
         
         Returns:
-            A random proxy or None if the list is empty
+            A random proxy or None if no proxy is available
         """
-        if not self.proxy_list:
-            self.logger.warning("No proxies available")
-            return None
-        
-        return random.choice(self.proxy_list)
+        while self._active:
+            index = self._active[random.randrange(len(self._active))]
+            proxy = self.proxy_list[index]
+            if isinstance(proxy, str):
+                # Entries passed as strings are parsed on first use and cached in place
+                try:
+                    proxy = self.proxy_list[index] = self._parse_proxy(proxy)
+                except Exception as e:
+                    # Unparsable entry - take it out of rotation so it is never picked again
+                    self.logger.error("Invalid proxy format: %s, error: %s", proxy, e)
+                    self._active.remove(index)
+                    continue
+            self._current_index = index
+            return proxy
+
+        self.logger.warning("No proxies available")
+        self._current_index = None
+        return None
     
     def should_change_proxy(self) -> bool:
         """
@@ -97,10 +150,8 @@ class ProxyManager:
                 return True
         
         # If the current proxy has too many errors
-        proxy_key = str(self.current_proxy)
-        if proxy_key in self.proxy_errors:
-            if self.proxy_errors[proxy_key] >= 3:  # Maximum number of errors
-                return True
+        if self.proxy_errors.get(_proxy_key(self.current_proxy), 0) >= _MAX_PROXY_ERRORS:
+            return True
         
         return False
     
@@ -123,6 +174,17 @@ class ProxyManager:
         
         return self.current_proxy
     
+    def proxy_session_key(self) -> Optional[Hashable]:
+        """
+        Returns the identity of the current proxy for keying per-proxy sessions
+        
+        Returns:
+            ``(host, port)`` of the current proxy or None if no proxy is selected
+        """
+        if self.current_proxy is None:
+            return None
+        return _proxy_key(self.current_proxy)
+    
     def report_error(self, error_type: str) -> None:
         """
         Registers a proxy error
@@ -131,16 +193,21 @@ class ProxyManager:
             error_type: Type of error (http, timeout, etc.)
         """
         if self.current_proxy:
-            proxy_key = str(self.current_proxy)
-            self.proxy_errors[proxy_key] = self.proxy_errors.get(proxy_key, 0) + 1
-            self.logger.warning(f"Proxy error: {error_type} for {proxy_key}, errors: {self.proxy_errors[proxy_key]}")
+            proxy_key = _proxy_key(self.current_proxy)
+            errors = self.proxy_errors[proxy_key] = self.proxy_errors.get(proxy_key, 0) + 1
+            self.logger.warning(f"Proxy error: {error_type} for {proxy_key}, errors: {errors}")
             
-            # If there are too many errors, reset the proxy
-            if self.proxy_errors[proxy_key] >= 3:
+            # If there are too many errors, take the proxy out of rotation and reset it
+            if errors >= _MAX_PROXY_ERRORS:
+                if self._current_index in self._active:
+                    self._active.remove(self._current_index)
                 self.current_proxy = None
+                self._current_index = None
     
     def reset_state(self) -> None:
         """Resets the proxy state"""
         self.current_proxy = None
+        self._current_index = None
         self.requests_with_current_proxy = 0
         self.proxy_errors.clear()
+        self._active = list(range(len(self.proxy_list)))
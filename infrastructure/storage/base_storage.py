@@ -1,14 +1,57 @@
+import os
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from operator import itemgetter
+from typing import List, Dict, Any, Set, Tuple
+
+from core.data_models import PRODUCT_ITEM_FIELDS
+
+# Extract ProductItem fields (in declaration order) from a row dict in C
+_get_product_values = itemgetter(*PRODUCT_ITEM_FIELDS)
+_EMPTY_PRODUCT_ROW: Dict[str, Any] = dict.fromkeys(PRODUCT_ITEM_FIELDS, '')
+
+
+# Output directories already created during this process
+_ensured_dirs: Set[str] = set()
+
+
+def ensure_dir(filename: str) -> None:
+    """Create the parent directory of *filename* once per process."""
+    dirname = os.path.dirname(filename) or '.'
+    if dirname not in _ensured_dirs:
+        os.makedirs(dirname, exist_ok=True)
+        _ensured_dirs.add(dirname)
+
+
+def product_rows(data: List[Dict[str, Any]]) -> List[Tuple[Any, ...]]:
+    """Convert row dicts to tuples ordered as PRODUCT_ITEM_FIELDS.
+
+    Extra keys are dropped, missing fields are filled with an empty string.
+    """
+    rows = []
+    append = rows.append
+    for row in data:
+        try:
+            append(_get_product_values(row))
+        except KeyError:
+            # Rare for transformed items, which always carry every field
+            append(_get_product_values({**_EMPTY_PRODUCT_ROW, **row}))
+    return rows
+
 
 class BaseStorage(ABC):
     """Base abstract class for data storage"""
 
+    def __init__(self) -> None:
+        # Number of items written by the last ``save`` call
+        self.items_saved: int = 0
+
     @abstractmethod
     async def save(self, data: List[Dict[str, Any]], filename: str) -> None:
         """
         Args:
             data: List of dictionaries with data
             filename: Filename or identifier for saving
+
+        Implementations must update ``items_saved`` with the number of written items.
         """
         pass
@@ -1,9 +1,9 @@
 import csv
+import io
 import aiofiles
 from typing import List, Dict, Any
-from os import makedirs, path
-from .base_storage import BaseStorage
-from core.data_models import ProductItem
+from .base_storage import BaseStorage, ensure_dir, product_rows
+from core.data_models import PRODUCT_ITEM_FIELDS
 from infrastructure.storage.registry import StorageRegistry
 
 @StorageRegistry.register('csv')
@@ -15,63 +15,25 @@ class CsvStorage(BaseStorage):
             data: List of dictionaries with data
             filename: Filename for saving
         """
+        self.items_saved = 0
         if not data:
             return
 
         # Create directory if it doesn't exist
-        makedirs(path.dirname(path.abspath(filename)), exist_ok=True)
+        ensure_dir(filename)
 
-        # Get ProductItem fields for headers and order
-        fieldnames = list(ProductItem.schema()['properties'].keys())
+        # Tuples ordered as ProductItem fields (only necessary fields)
+        rows = product_rows(data)
 
-        # Convert all rows to the required format (only necessary fields, order as in ProductItem)
-        filtered_data = []
-        for row in data:
-            filtered_row = {field: row.get(field, '') for field in fieldnames}
-            filtered_data.append(filtered_row)
+        # Format the whole payload in memory with the C csv writer, then write it once
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, delimiter=';', quoting=csv.QUOTE_MINIMAL, lineterminator='\n')
+        writer.writerow(PRODUCT_ITEM_FIELDS)
+        writer.writerows(rows)
 
-        # Optimized writing with buffering
-        buffer_size = 1024 * 1024  # 1 MB
-        buffer = []
-        buffer_bytes = 0
-        
-        # Add header
-        header = ';'.join(fieldnames) + '\n'
-        buffer.append(header)
-        buffer_bytes = len(header.encode('utf-8'))
-        
-        # Add data rows
-        for item in filtered_data:
-            row = []
-            for field in fieldnames:
-                value = item.get(field, '')
-                # Escape special characters
-                if isinstance(value, str) and any(c in value for c in [';', '"', '\n']):
-                    value = f'"{value.replace('"', '""')}"'
-                row.append(str(value))
-            
-            row_str = ';'.join(row) + '\n'
-            row_bytes = len(row_str.encode('utf-8'))
-            
-            # If the buffer fills up after adding this row, write it first
-            if buffer_bytes + row_bytes > buffer_size:
-                async with aiofiles.open(filename, 'w' if buffer[0] == header else 'a', encoding='utf-8') as f:
-                    await f.write(''.join(buffer))
-                buffer = [row_str]
-                buffer_bytes = row_bytes
-            else:
-                buffer.append(row_str)
-                buffer_bytes += row_bytes
-        
-        # Write remaining data
-        if buffer:
-            async with aiofiles.open(filename, 'w' if buffer[0] == header else 'a', encoding='utf-8') as f:
-                await f.write(''.join(buffer))
-
-        #with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-        #    writer = csv.DictWriter(csvfile, fieldnames=fieldnames, delimiter=';')
-        #    writer.writeheader()
-        #    writer.writerows(data)
+        async with aiofiles.open(filename, 'w', encoding='utf-8', newline='', buffering=1 << 20) as f:
+            await f.write(buffer.getvalue())
+        self.items_saved = len(rows)
 
     async def close(self) -> None:
         pass
@@ -1,9 +1,8 @@
 import aiofiles
-import json
+import orjson
 from typing import List, Dict, Any
-from os import makedirs, path
-from .base_storage import BaseStorage
-from core.data_models import ProductItem
+from .base_storage import BaseStorage, ensure_dir, product_rows
+from core.data_models import PRODUCT_ITEM_FIELDS
 from infrastructure.storage.registry import StorageRegistry
 
 @StorageRegistry.register('json')
@@ -15,18 +14,21 @@ class JsonStorage(BaseStorage):
             data: List of dictionaries with data
             filename: Filename for saving
         """
+        self.items_saved = 0
         if not data:
             return
-        makedirs(path.dirname(path.abspath(filename)), exist_ok=True)
-        # Get ProductItem fields for headers and order
-        fieldnames = list(ProductItem.schema()['properties'].keys())
+        ensure_dir(filename)
         # Convert all rows to the required format (only necessary fields, order as in ProductItem)
-        filtered_data = []
-        for row in data:
-            filtered_row = {field: row.get(field, '') for field in fieldnames}
-            filtered_data.append(filtered_row)
-        async with aiofiles.open(filename, 'w', encoding='utf-8') as f:
-            await f.write(json.dumps(filtered_data, ensure_ascii=False, indent=2))
+        fieldnames = PRODUCT_ITEM_FIELDS
+        filtered_data = [dict(zip(fieldnames, values)) for values in product_rows(data)]
+        # orjson produces UTF-8 bytes directly, so the file is opened in binary mode
+        async with aiofiles.open(filename, 'wb') as f:
+            await self._write(f, filtered_data)
+        self.items_saved = len(filtered_data)
+
+    async def _write(self, f, rows: List[Dict[str, Any]]) -> None:
+        """Write *rows* to the already opened binary file as one indented JSON array."""
+        await f.write(orjson.dumps(rows, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
 
     async def close(self) -> None:
-        pass 
\ No newline at end of file
+        pass
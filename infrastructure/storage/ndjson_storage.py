@@ -0,0 +1,12 @@
+import orjson
+from typing import List, Dict, Any
+from .json_storage import JsonStorage
+from infrastructure.storage.registry import StorageRegistry
+
+@StorageRegistry.register('ndjson')
+class NdjsonStorage(JsonStorage):
+    """Newline-delimited JSON: one object per line, no enclosing array."""
+
+    async def _write(self, f, rows: List[Dict[str, Any]]) -> None:
+        # One write call: each aiofiles write is a thread-pool round trip
+        await f.write(b''.join([orjson.dumps(row) + b'\n' for row in rows]))
@@ -2,6 +2,8 @@ from typing import Type, Dict
 
 from infrastructure.storage.base_storage import BaseStorage
 
+_MISSING = object()
+
 class StorageRegistry:
     _registry: Dict[str, Type[BaseStorage]] = {}
 
@@ -15,6 +17,7 @@ class StorageRegistry:
 
     @classmethod
     def get(cls, name: str) -> Type[BaseStorage]:
-        if name not in cls._registry:
+        storage_cls = cls._registry.get(name, _MISSING)
+        if storage_cls is _MISSING:
             raise KeyError(f"Storage '{name}' is not registered")
-        return cls._registry[name] 
\ No newline at end of file
+        return storage_cls 
\ No newline at end of file
@@ -0,0 +1,3 @@
+# Generated by utils/parser_imports.py - do not edit manually.
+# Importing the modules registers their parsers via @register_parser_decorator.
+from . import knifecenter_parser  # noqa: F401
@@ -1,11 +1,13 @@
+import asyncio
 from typing import List, Dict, Any, Optional, Type
 from urllib.parse import urljoin
 
-from lxml import html
+from lxml import etree, html
 from pydantic import BaseModel
+from yarl import URL
 
-from utils.html_utils import extract_price, extract
-from core.base_scraper import BaseScraper
+from utils.html_utils import extract_price
+from core.base_scraper import BaseScraper, ThreadedParserMixin
 from config.config_manager import ConfigManager
 from parsers.parser_registry import register_parser_decorator
 
@@ -14,13 +16,26 @@ from core.exceptions import ScraperError
 from infrastructure.http_client import HttpClient  # typing-only but lightweight
 from infrastructure.storage.base_storage import BaseStorage  # typing-only
 
+# XPath expressions compiled once at import instead of on every call
+_XP_SKU = etree.XPath(".//div[@class='purchase-row']//a/@data-sku")
+_XP_PRICE = etree.XPath(".//span[@class='our_price']/text()")
+_XP_ITEM_URL = etree.XPath("./a[@class='product_name']/@href")
+_XP_NAME = etree.XPath(".//a[@class='product_name']/div[not(contains(@class, 'image-container'))]/text()")
+_XP_LISTING_ITEMS = etree.XPath("//div[contains(@class, 'listing_item')]")
+_XP_CATEGORY_URLS = etree.XPath("//a[@class='all']/@href")
+_XP_PRODUCT_URLS = etree.XPath("//div[@class='grid-style1__item']/a/@href")
+_XP_NEXT_PAGE = etree.XPath("//a[@class='next']/@href")
+
 class KnifecenterConfig(BaseModel):
     """Knifecenter specific configurations."""
     base_url: str = 'https://www.knifecenter.com'
     items_per_page: int = 36
+    max_concurrent_product_fetches: int = 10
 
 @register_parser_decorator('knifecenter', 'knifecenter.com parser')
-class KnifecenterScraper(BaseScraper):
+class KnifecenterScraper(ThreadedParserMixin, BaseScraper):
+    __slots__ = ("_product_semaphore", "_listing_semaphore")
+
     config: KnifecenterConfig
 
     @property
@@ -41,17 +56,25 @@ class KnifecenterScraper(BaseScraper):
             storage: Data storage
         """
         super().__init__(shop_name, config_manager, http_client, storage)
+        # Bounds product page downloads running concurrently across all listing pages
+        self._product_semaphore = asyncio.Semaphore(self.config.max_concurrent_product_fetches)
+        # Bounds category/listing page downloads, which fan out recursively from the catalog
+        self._listing_semaphore = asyncio.Semaphore(self.config_manager.config.concurrency)
 
-    async def parse_item(self, item: Dict[str, Any]) -> Dict[str, Any]:
-        """Parse item"""
-        sku = extract(item.xpath(".//div[@class='purchase-row']//a/@data-sku"))
+    def parse_item(self, item: html.HtmlElement) -> Dict[str, Any]:
+        """Parse item (pure CPU work, so a plain method rather than a coroutine)"""
+        # First match or None, inlined instead of calling extract() per field
+        sku = _XP_SKU(item)
+        sku = sku[0] if sku else None
 
-        price_text = extract(item.xpath(".//span[@class='our_price']/text()"))
-        price = extract_price(price_text)
+        price_text = _XP_PRICE(item)
+        price = extract_price(price_text[0]) if price_text else None
 
-        item_url = extract(item.xpath("./a[@class='product_name']/@href"))
+        item_url = _XP_ITEM_URL(item)
+        item_url = item_url[0] if item_url else None
 
-        name = extract(item.xpath(".//a[@class='product_name']/div[not(contains(@class, 'image-container'))]/text()"))
+        name = _XP_NAME(item)
+        name = name[0] if name else None
         if item_url is not None:
             item_url = urljoin(self.config.base_url, item_url)
 
@@ -63,9 +86,9 @@ class KnifecenterScraper(BaseScraper):
             'price_regular': price,
         }
 
-    async def parse_page(self, html_content: str, url: str) -> List[Dict[str, Any]]:
+    def parse_page_sync(self, html_content: str, url: str) -> List[Dict[str, Any]]:
         """
-        Parse HTML content and extract items
+        Parse HTML content and extract items (runs in a worker thread via parse_page)
         Args:
             html_content: HTML page content
             url: Page URL
@@ -73,7 +96,8 @@ class KnifecenterScraper(BaseScraper):
             List of extracted items
         """
         tree = html.fromstring(html_content)
-        return [await self.parse_item(node) for node in tree.xpath("//div[contains(@class, 'listing_item')]")]
+        parse_item = self.parse_item
+        return [parse_item(node) for node in _XP_LISTING_ITEMS(tree)]
 
     async def _handle_main_or_category_page(self, tree: html.HtmlElement, current_url: str) -> bool:
         """
@@ -81,30 +105,28 @@ class KnifecenterScraper(BaseScraper):
         Returns True if it was a main/category page and was processed, False otherwise.
         """
         # Main page (e.g., /knife.html) or category page - look for 'all' links
-        category_or_sub_category_urls = tree.xpath("//a[@class='all']/@href")
+        category_or_sub_category_urls = _XP_CATEGORY_URLS(tree)
         if category_or_sub_category_urls:
             full_urls = [urljoin(current_url, u) for u in category_or_sub_category_urls]
-            self.logger.info(f"Found {len(full_urls)} category/sub-category links on {current_url}")
-            for cat_url in full_urls:
-                # Recursively call process_url for each found category/sub-category
-                await self.process_url(cat_url)
+            self.logger.info("Found %s category/sub-category links on %s", len(full_urls), current_url)
+            # Recursively call process_url for each found category/sub-category
+            await self._gather_logged(map(self.process_url, full_urls), current_url)
             return True
         return False
 
-    async def _handle_product_listing_page(self, tree: html.HtmlElement, current_url: str, content: str) -> None:
+    async def _handle_product_listing_page(self, tree: html.HtmlElement, current_url: str) -> None:
         """
         Handles a product listing page by extracting product URLs and processing pagination.
         """
         # Page with products - extract links to the products themselves
-        product_urls = tree.xpath("//div[@class='grid-style1__item']/a/@href")
+        product_urls = _XP_PRODUCT_URLS(tree)
         if product_urls: # Ensure there are product URLs before attempting to join
             full_product_urls = [urljoin(current_url, u) for u in product_urls]
-            self.logger.info(f"Found {len(full_product_urls)} product links on {current_url}")
-            for prod_url in full_product_urls:
-                await self.process_product_page(prod_url)
+            self.logger.info("Found %s product links on %s", len(full_product_urls), current_url)
+            await self._gather_logged(map(self.process_product_page, full_product_urls), current_url)
 
         # Pagination should always be processed for product listing pages
-        await self.process_pagination(current_url, content)
+        await self._process_pagination_tree(current_url, tree)
 
     async def process_url(self, url: str) -> None:
         """
@@ -113,11 +135,17 @@ class KnifecenterScraper(BaseScraper):
         Args:
             url: Page URL
         """
-        self.logger.info(f"Processing URL: {url}")
+        if not self._mark_visited(url):
+            self.logger.debug("Skipping already processed URL: %s", url)
+            return
+
+        self.logger.info("Processing URL: %s", url)
         try:
-            content = await self.get_page_content(url)
+            # Held only for the download, never across the recursion into linked pages
+            async with self._listing_semaphore:
+                content = await self.get_page_content(url)
             if not content:
-                self.logger.error(f"Failed to get content for {url}")
+                self.logger.error("Failed to get content for %s", url)
                 return
 
             tree = html.fromstring(content)
@@ -127,10 +155,10 @@ class KnifecenterScraper(BaseScraper):
                 return # If it was a category page, its job is done
 
             # If not a category page, assume it's a product listing page (or a page leading to products)
-            await self._handle_product_listing_page(tree, url, content)
+            await self._handle_product_listing_page(tree, url)
 
         except Exception as e:
-            self.logger.error(f"Error processing {url}: {str(e)}")
+            self.logger.error("Error processing %s: %s", url, e)
 
     async def process_product_page(self, url: str) -> None:
         """
@@ -138,23 +166,60 @@ class KnifecenterScraper(BaseScraper):
         Args:
             url: Product page URL
         """
-        content = await self.get_page_content(url)
+        if not self._mark_visited(url):
+            self.logger.debug("Skipping already processed product page: %s", url)
+            return
+        async with self._product_semaphore:
+            content = await self.get_page_content(url)
         if not content:
-            self.logger.error(f"Failed to get product page: {url}")
+            self.logger.error("Failed to get product page: %s", url)
             return
         items = await self.parse_page(content, url)
         await self.process_items(items)
 
+    def _mark_visited(self, url: str) -> bool:
+        """
+        Records *url* as processed; category cross-links and cyclic pagination lead back to seen pages
+        Args:
+            url: Page URL
+        Returns:
+            False if the URL (without fragment, host lowercased) was already processed
+        """
+        try:
+            canonical = URL(url).with_fragment(None).human_repr()
+        except ValueError:
+            canonical = url
+        url_hash = hash(canonical)
+        if url_hash in self._processed_urls:
+            return False
+        self._processed_urls.add(url_hash)
+        return True
+
+    async def _gather_logged(self, coros, current_url: str) -> None:
+        """Run coroutines concurrently; log failures instead of aborting the remaining ones."""
+        results = await asyncio.gather(*coros, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                self.logger.error("Error processing link from %s: %s", current_url, result)
+
     async def process_pagination(self, url: str, content: str) -> None:
         """
         Handles pagination on product pages
         Args:
             url: URL of the current page
-            content: HTML code of the page
+            content: HTML content of the page
+        """
+        await self._process_pagination_tree(url, html.fromstring(content))
+
+    async def _process_pagination_tree(self, url: str, tree: html.HtmlElement) -> None:
+        """
+        Follows the next-page link of an already parsed listing page
+        Args:
+            url: URL of the current page
+            tree: Already parsed HTML tree of the page
         """
-        tree = html.fromstring(content)
-        next_page = extract(tree.xpath("//a[@class='next']/@href"))
-        if next_page:
-            next_url = urljoin(url, next_page)
-            self.logger.info(f"Found next page: {next_url}")
+        next_page = _XP_NEXT_PAGE(tree)
+        if next_page and next_page[0]:
+            next_url = urljoin(url, next_page[0])
+            self.logger.info("Found next page: %s", next_url)
             await self.process_url(next_url) 
\ No newline at end of file
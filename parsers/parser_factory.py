@@ -1,5 +1,5 @@
 import inspect
-from typing import Dict, Type
+from typing import Dict, Optional, Type
 
 from core.base_scraper import BaseScraper
 from core.exceptions import UnknownParserError
@@ -11,6 +11,8 @@ class ParserFactory:
 
     _parsers: Dict[str, Type[BaseScraper]] = None
     _descriptions: Dict[str, str] = None
+    # Docstring-based listing, built on first list_parsers() call
+    _listing_cache: Optional[Dict[str, str]] = None
 
     @classmethod
     def _ensure_initialized(cls):
@@ -37,10 +39,10 @@ class ParserFactory:
             UnknownParserError: If the parser type is not supported
         """
         cls._ensure_initialized()
-        if parser_type not in cls._parsers:
+        parser_cls = cls._parsers.get(parser_type)
+        if parser_cls is None:
             raise UnknownParserError(parser_type, list(cls._parsers.keys()))
 
-        parser_cls = cls._parsers[parser_type]
         try:
             return parser_cls(shop_name=parser_type, config_manager=config_manager)
         except Exception as e:
@@ -54,13 +56,15 @@ class ParserFactory:
         Returns:
             A dictionary with parser types and their descriptions
         """
-        cls._ensure_initialized()
-        descriptions = {}
-        for name, parser_cls in cls._parsers.items():
-            docstring = inspect.getdoc(parser_cls)
-            description = docstring.split('\n')[0] if docstring else "No description available."
-            descriptions[name] = description
-        return descriptions.copy()
+        if cls._listing_cache is None:
+            cls._ensure_initialized()
+            descriptions = {}
+            for name, parser_cls in cls._parsers.items():
+                docstring = inspect.getdoc(parser_cls)
+                description = docstring.split('\n')[0] if docstring else "No description available."
+                descriptions[name] = description
+            cls._listing_cache = descriptions
+        return cls._listing_cache.copy()
 
     @classmethod
     def register_parser(cls, parser_type: str, parser_class: Type[BaseScraper], description: str = ""):
@@ -76,6 +80,7 @@ class ParserFactory:
         if not issubclass(parser_class, BaseScraper):
             raise TypeError(f"{parser_class.__name__} must inherit from BaseScraper.")
         cls._parsers[parser_type] = parser_class
+        cls._listing_cache = None
         if hasattr(cls, '_descriptions'):
             cls._descriptions[parser_type] = description
         else:
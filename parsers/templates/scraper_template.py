@@ -11,7 +11,6 @@ from parsers.parser_registry import register_parser_decorator
 
 @register_parser_decorator('example_shop', '{description}')
 class ExampleShopScraper(BaseScraper):
-
     def __init__(self,
                  shop_name: str = "example_shop",
                  config_manager: Optional[ConfigManager] = None,
@@ -37,16 +36,17 @@ class ExampleShopScraper(BaseScraper):
             HTML content or None if error
         """
         try:
-            client = self.get_http_client()
-            async with client as client:
-                response = await client.get(url)
-                if response:
-                    return response
-                else:
-                    self.logger.error(f"Empty response for URL: {url}")
-                    return None
+            # Clients are opened once in BaseScraper.__aenter__ and closed in __aexit__;
+            # entering one here would close its session (and pooled connections) after each URL
+            client = await self.get_http_client()
+            response = await client.get(url)
+            if response:
+                return response
+            else:
+                self.logger.error("Empty response for URL: %s", url)
+                return None
         except Exception as e:
-            self.logger.error(f"Error getting page content for {url}: {str(e)}")
+            self.logger.error("Error getting page content for %s: %s", url, e)
             return None
 
     async def parse_page(self, html_content: str, url: str) -> List[Dict[str, Any]]:
@@ -59,6 +59,10 @@ class ExampleShopScraper(BaseScraper):
             List of extracted items
         """
         # TODO: Implement parsing logic
+        # Parse the page once and run module-level precompiled expressions against the tree,
+        # e.g. _XP_ITEMS = etree.XPath("//div[@class='item']") and then _XP_ITEMS(tree):
+        #   tree = html.fromstring(html_content)
+        #   return [self.parse_item(node) for node in _XP_ITEMS(tree)]
         return []
 
     async def process_url(self, url: str) -> None:
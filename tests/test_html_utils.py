@@ -0,0 +1,11 @@
+from utils.html_utils import extract_price, extract_prices
+
+
+def test_extract_prices_matches_extract_price():
+    texts = ["$1,299.99", None, "", "no price", "1.234.56", "€ 15,50"]
+    assert extract_prices(texts) == [extract_price(text) for text in texts]
+
+
+def test_extract_prices_text_with_nul_keeps_alignment():
+    texts = ["$10.00", "12\x0034", "$5.50"]
+    assert extract_prices(texts) == [10.0, extract_price("12\x0034"), 5.5]
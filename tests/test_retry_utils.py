@@ -0,0 +1,35 @@
+import asyncio
+
+import pytest
+
+from config.config_manager import ConfigManager
+from utils import retry_utils
+from utils.retry_utils import async_retry
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    recorded = []
+
+    async def fake_sleep(delay):
+        recorded.append(delay)
+
+    monkeypatch.setattr(retry_utils.asyncio, "sleep", fake_sleep)
+    return recorded
+
+
+def test_backoff_factor_taken_from_retry_config(sleeps):
+    config_manager = ConfigManager("retry_test", config_dir="missing_config_dir")
+    config_manager.update_config(retry={"backoff_factor": 3.0})
+    calls = []
+
+    @async_retry(retries=2, delay=0.5, exceptions=(ValueError,), config_manager=config_manager)
+    async def flaky():
+        calls.append(1)
+        if len(calls) < 3:
+            raise ValueError("boom")
+        return "ok"
+
+    assert asyncio.run(flaky()) == "ok"
+    assert len(calls) == 3
+    assert sleeps == [0.5, 1.5]
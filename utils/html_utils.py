@@ -1,6 +1,16 @@
 import re
 from typing import Optional, List, Any
 
+# Patterns are compiled once at import instead of being looked up in re's cache per call
+_WS_RE = re.compile(r'\s+')
+
+# Price cleaning runs as a C-level byte-table scan: non-ASCII is dropped by the encode,
+# every byte outside [0-9.,] is deleted and comma becomes period in a single translate
+_PRICE_TABLE = bytes.maketrans(b',', b'.')
+_PRICE_DELETE = bytes(c for c in range(256) if chr(c) not in '0123456789.,')
+# Same for a batch joined with NUL, which is kept as separator (texts containing NUL take the per-item path)
+_PRICE_DELETE_BATCH = _PRICE_DELETE.replace(b'\x00', b'')
+
 def clean_text(text: str) -> str:
     """
     Cleans text from extra spaces and line breaks.
@@ -13,7 +23,7 @@ def clean_text(text: str) -> str:
     if not text:
         return ""
     
-    text = re.sub(r'\s+', ' ', text)
+    text = _WS_RE.sub(' ', text)
     return text.strip()
 
 def extract_price(text: str) -> Optional[float]:
@@ -28,22 +38,56 @@ def extract_price(text: str) -> Optional[float]:
     if not text:
         return None
     
-    # Remove all non-numeric characters except for period and comma
-    price_text = re.sub(r'[^\d.,]', '', text)
-    
-    price_text = price_text.replace(',', '.')
+    # Remove all non-numeric characters except for period and comma, comma becomes period
+    price_text = text.encode('ascii', 'ignore').translate(_PRICE_TABLE, _PRICE_DELETE)
     
     # If multiple periods exist, assume the last one
     # todo: double check this part
-    if price_text.count('.') > 1:
-        parts = price_text.split('.')
-        price_text = ''.join(parts[:-1]) + '.' + parts[-1]
+    if price_text.count(b'.') > 1:
+        last_dot = price_text.rfind(b'.')
+        price_text = price_text[:last_dot].replace(b'.', b'') + price_text[last_dot:]
             
     try:
         return float(price_text)
     except ValueError:
         return None
 
+def extract_prices(texts: List[Optional[str]]) -> List[Optional[float]]:
+    """
+    Extracts prices from many text strings at once (same rules as extract_price).
+
+    The texts are cleaned together: one encode and one translate over the joined
+    batch instead of one per string. If any text contains NUL (the batch separator),
+    each text is parsed with extract_price instead.
+
+    Args:
+        texts: Texts containing prices (empty values are allowed).
+    Returns:
+        Prices in the same order, None where a price cannot be found or parsed.
+    """
+    if not texts:
+        return []
+
+    texts = [text or '' for text in texts]
+    if any('\x00' in text for text in texts):
+        return [extract_price(text) for text in texts]
+
+    joined = '\x00'.join(texts)
+    cleaned = joined.encode('ascii', 'ignore').translate(_PRICE_TABLE, _PRICE_DELETE_BATCH)
+
+    prices: List[Optional[float]] = []
+    append = prices.append
+    for price_text in cleaned.split(b'\x00'):
+        # If multiple periods exist, assume the last one
+        if price_text.count(b'.') > 1:
+            last_dot = price_text.rfind(b'.')
+            price_text = price_text[:last_dot].replace(b'.', b'') + price_text[last_dot:]
+        try:
+            append(float(price_text))
+        except ValueError:
+            append(None)
+    return prices
+
 def extract(elements: List[Any], default: Any = None) -> Any:
     """
     Extracts the first element from a list or returns a default value.
@@ -1,13 +1,169 @@
+import atexit
 import logging
-import logging.config
+import logging.handlers
 import os
-from typing import Optional
+import queue
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
 
 from config.config_manager import ConfigManager
 
 
 DEFAULT_LOG_DIR = "logs"
 
+_FORMATTER = logging.Formatter(
+    fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S',
+)
+
+# Handlers are built once and shared by every scraper logger that needs them:
+# the console handler by all, file handlers by log file path
+_console_handler: Optional[logging.Handler] = None
+_HANDLERS: Dict[str, logging.Handler] = {}
+# Background threads writing queued records to the log files
+_LISTENERS: List[logging.handlers.QueueListener] = []
+# Log file paths by (log_dir, configured file name); their directories already exist
+_LOG_PATHS: Dict[Tuple[str, str], str] = {}
+
+
+class _BufferedRotatingFileHandler(logging.Handler):
+    """Size-rotated log file written in batches with ``os.write``.
+
+    Records are encoded into a bytearray that is written with a single syscall once it
+    holds ``buffer_size`` bytes or ``flush_interval`` seconds have passed since the last
+    write. Rotation follows ``RotatingFileHandler`` naming (``file.1`` … ``file.N``).
+    """
+
+    def __init__(self, filename: str, max_bytes: int, backup_count: int,
+                 buffer_size: int = 64 * 1024, flush_interval: float = 0.05) -> None:
+        super().__init__()
+        self.filename = os.path.abspath(filename)
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self._buffer = bytearray()
+        self._last_flush = time.monotonic()
+        self._open()
+
+    def _open(self) -> None:
+        self._fd = os.open(self.filename, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        self._size = os.fstat(self._fd).st_size
+
+    def _rollover(self) -> None:
+        os.close(self._fd)
+        for i in range(self.backup_count - 1, 0, -1):
+            source = f"{self.filename}.{i}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.filename}.{i + 1}")
+        if self.backup_count > 0:
+            os.replace(self.filename, f"{self.filename}.1")
+        else:
+            os.truncate(self.filename, 0)
+        self._open()
+
+    def _write_buffer(self) -> None:
+        if not self._buffer:
+            return
+        if self.max_bytes > 0 and self._size and self._size + len(self._buffer) > self.max_bytes:
+            self._rollover()
+        os.write(self._fd, self._buffer)
+        self._size += len(self._buffer)
+        self._buffer.clear()
+        self._last_flush = time.monotonic()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self._buffer += (self.format(record) + '\n').encode('utf-8')
+            if (len(self._buffer) >= self.buffer_size
+                    or time.monotonic() - self._last_flush >= self.flush_interval):
+                self._write_buffer()
+        except Exception:
+            self.handleError(record)
+
+    @property
+    def pending(self) -> bool:
+        """True if records are buffered but not yet written."""
+        return bool(self._buffer)
+
+    def flush(self) -> None:
+        with self.lock:
+            self._write_buffer()
+
+    def close(self) -> None:
+        with self.lock:
+            try:
+                self._write_buffer()
+            finally:
+                if self._fd is not None:
+                    os.close(self._fd)
+                    self._fd = None
+        super().close()
+
+
+class _FlushingQueueListener(logging.handlers.QueueListener):
+    """QueueListener that flushes its handlers whenever the queue stays idle briefly,
+    so buffered records reach the file even when no further records arrive.
+
+    With nothing buffered it blocks on the queue without a timeout, so an idle
+    listener thread does not wake up at all.
+    """
+
+    flush_interval = 0.05
+
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        while True:
+            pending = [handler for handler in self.handlers if handler.pending]
+            if not pending:
+                return self.queue.get()
+            try:
+                return self.queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                for handler in pending:
+                    handler.flush()
+
+
+def _get_console_handler() -> logging.Handler:
+    global _console_handler
+    if _console_handler is None:
+        _console_handler = logging.StreamHandler(sys.stdout)
+        _console_handler.setFormatter(_FORMATTER)
+    return _console_handler
+
+
+def _get_file_handler(log_file: str) -> logging.Handler:
+    """Return the queue handler for *log_file*.
+
+    Disk writes and rotation checks happen in a QueueListener thread, so logging
+    from coroutines never blocks the event loop on file I/O; the file handler
+    there batches records into few write syscalls.
+    """
+    handler = _HANDLERS.get(log_file)
+    if handler is None:
+        file_handler = _BufferedRotatingFileHandler(
+            log_file,
+            max_bytes=10 * 1024 * 1024,
+            backup_count=5,
+        )
+        file_handler.setFormatter(_FORMATTER)
+        record_queue: queue.SimpleQueue = queue.SimpleQueue()
+        listener = _FlushingQueueListener(record_queue, file_handler)
+        listener.start()
+        _LISTENERS.append(listener)
+        handler = _HANDLERS[log_file] = logging.handlers.QueueHandler(record_queue)
+    return handler
+
+
+@atexit.register
+def _stop_listeners() -> None:
+    """Flush queued records to disk before the interpreter exits."""
+    while _LISTENERS:
+        listener = _LISTENERS.pop()
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
 
 def get_scraper_logger(scraper_name: str, config_manager: ConfigManager, log_dir: Optional[str] = None) -> logging.Logger:
     """
@@ -23,49 +179,27 @@ def get_scraper_logger(scraper_name: str, config_manager: ConfigManager, log_dir
     """
     effective_log_dir = log_dir or DEFAULT_LOG_DIR
     #log_file = os.path.join(effective_log_dir, f"{scraper_name.lower()}.log")
-    log_file = os.path.join(effective_log_dir, f"{config_manager.config.log_file.lower()}")
+    path_key = (effective_log_dir, config_manager.config.log_file)
+    log_file = _LOG_PATHS.get(path_key)
+    if log_file is None:
+        # Create logs directory if it doesn't exist (once per path)
+        os.makedirs(effective_log_dir, exist_ok=True)
+        log_file = _LOG_PATHS[path_key] = os.path.join(effective_log_dir, path_key[1].lower())
     
 
     log_level_str = getattr(config_manager.config, 'log_level', 'INFO').upper()
     logger_name = f"scraper.{scraper_name}"
 
-    log_config = {
-        'version': 1,
-        'disable_existing_loggers': False,
-        'formatters': {
-            'standard': {
-                'format': '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-                'datefmt': '%Y-%m-%d %H:%M:%S',
-            },
-        },
-        'handlers': {
-            'console': {
-                'class': 'logging.StreamHandler',
-                'level': log_level_str,
-                'formatter': 'standard',
-                'stream': 'ext://sys.stdout',
-            },
-            'file': {
-                'class': 'logging.handlers.RotatingFileHandler',
-                'level': log_level_str,
-                'formatter': 'standard',
-                'filename': log_file,
-                'maxBytes': 10 * 1024 * 1024,
-                'backupCount': 5,
-                'encoding': 'utf-8',
-            },
-        },
-        'loggers': {
-            logger_name: {
-                'handlers': ['console', 'file'],
-                'level': log_level_str,
-                'propagate': False,
-            }
-        }
-    }
-    
-    # Create logs directory if it doesn't exist
-    os.makedirs(effective_log_dir, exist_ok=True)
-    
-    logging.config.dictConfig(log_config)
-    return logging.getLogger(logger_name)
+    handlers = (_get_console_handler(), _get_file_handler(log_file))
+
+    logger = logging.getLogger(logger_name)
+    logger.setLevel(log_level_str)
+    logger.propagate = False
+    # Same result as reconfiguring the logger: exactly the wanted handlers attached
+    for handler in logger.handlers[:]:
+        if handler not in handlers:
+            logger.removeHandler(handler)
+    for handler in handlers:
+        if handler not in logger.handlers:
+            logger.addHandler(handler)
+    return logger
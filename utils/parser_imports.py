@@ -0,0 +1,40 @@
+from pathlib import Path
+import argparse
+
+IMPLEMENTATIONS_PATH = Path(__file__).parent.parent / 'parsers' / 'implementations'
+GENERATED_FILE = IMPLEMENTATIONS_PATH / '_generated_imports.py'
+
+HEADER = (
+    '# Generated by utils/parser_imports.py - do not edit manually.\n'
+    '# Importing the modules registers their parsers via @register_parser_decorator.\n'
+)
+
+
+def regenerate_parser_imports(implementations_path: Path = IMPLEMENTATIONS_PATH) -> Path:
+    """
+    Rewrites the static import list of parser implementation modules
+    Args:
+        implementations_path: Directory with parser implementations
+    Returns:
+        Path of the generated file
+    """
+    module_names = sorted(
+        file.stem for file in implementations_path.glob('*.py')
+        if not file.name.startswith('_')
+    )
+    lines = [HEADER]
+    if module_names:
+        lines.append(f"from . import {', '.join(module_names)}  # noqa: F401\n")
+
+    target_file = implementations_path / GENERATED_FILE.name
+    target_file.write_text(''.join(lines), encoding='utf-8')
+    return target_file
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Regenerate static parser imports")
+    parser.add_argument(
+        "--path", type=Path, default=IMPLEMENTATIONS_PATH, help="Directory with parser implementations"
+    )
+    args = parser.parse_args()
+    print(f"Parser imports written: {regenerate_parser_imports(args.path)}")
@@ -1,14 +1,29 @@
 import asyncio
 import functools
 import logging
-from typing import Callable, TypeVar, Optional
+import random
+from typing import Callable, Dict, Tuple, TypeVar, Optional
 from config.config_manager import ConfigManager
 
 T = TypeVar('T')
 
 logger = logging.getLogger(__name__)
 
-#todo: Implement a "strategy" pattern here with exponential-random and linear-random delays
+
+def _exponential_schedule(delay: float, backoff_factor: float, retries: int) -> Tuple[float, ...]:
+    return tuple(delay * backoff_factor ** i for i in range(retries))
+
+
+def _linear_schedule(delay: float, backoff_factor: float, retries: int) -> Tuple[float, ...]:
+    return tuple(delay * (i + 1) for i in range(retries))
+
+
+# Retry delay strategies: name -> (base schedule builder, apply random jitter)
+RETRY_STRATEGIES: Dict[str, Tuple[Callable[[float, float, int], Tuple[float, ...]], bool]] = {
+    "exponential": (_exponential_schedule, False),
+    "exponential_random": (_exponential_schedule, True),
+    "linear_random": (_linear_schedule, True),
+}
 
 
 def async_retry(
@@ -17,7 +32,8 @@ def async_retry(
     backoff_factor: Optional[float] = None,
     exceptions: tuple = (Exception,),
     on_retry: Optional[Callable[[Exception, int], None]] = None,
-    config_manager: Optional[ConfigManager] = None
+    config_manager: Optional[ConfigManager] = None,
+    strategy: str = "exponential",
 ):
     """
     Decorator to retry an asynchronous function execution.
@@ -30,18 +46,31 @@ def async_retry(
                         otherwise defaults to 2.0.
         exceptions: A tuple of exception types that should be caught and retried.
         on_retry: Callback function invoked when a retry occurs.Receives the exception and current attempt number.
-        config_manager: Optional ConfigManager to fetch backoff_factor if not explicitly set.
+        config_manager: Optional ConfigManager to fetch retry.backoff_factor if not explicitly set.
+        strategy: Delay strategy from RETRY_STRATEGIES. The "*_random" variants scale each
+                  delay by a random factor in [0.5, 1.5) so that concurrent callers spread out.
     """
+    try:
+        build_schedule, jitter = RETRY_STRATEGIES[strategy]
+    except KeyError:
+        raise ValueError(
+            f"Unknown retry strategy '{strategy}'. Available: {', '.join(RETRY_STRATEGIES)}"
+        ) from None
+
+    # Config is read once here and shared by every function decorated with this instance,
+    # so a config change mid-run cannot silently alter an already running retry schedule
+    if backoff_factor is None and config_manager is not None:
+        current_backoff_factor = config_manager.config.retry.backoff_factor
+    else:
+        current_backoff_factor = backoff_factor or 2.0 # todo: rework
+
+    # Sleep before each retry
+    sleeps = build_schedule(delay, current_backoff_factor, retries)
+
     def decorator(func):
         @functools.wraps(func)
         async def wrapper(*args, **kwargs):
             last_exception = None
-            current_delay = delay
-            
-            if backoff_factor is None and config_manager is not None:
-                current_backoff_factor = config_manager.config.backoff_factor
-            else:
-                current_backoff_factor = backoff_factor or 2.0 # todo: rework
 
             for attempt in range(retries + 1):
                 try:
@@ -50,18 +79,23 @@ def async_retry(
                     last_exception = e
 
                     if attempt < retries:
+                        current_delay = sleeps[attempt]
+                        if jitter:
+                            current_delay *= 0.5 + random.random()
                         if on_retry:
                             on_retry(e, attempt + 1)
                         else:
                             logger.warning(
-                                f"Attempt {attempt + 1}/{retries} failed with error: {str(e)}. "
-                                f"Retrying in {current_delay:.2f}s..."
+                                "Attempt %s/%s failed with error: %s. Retrying in %.2fs...",
+                                attempt + 1,
+                                retries,
+                                e,
+                                current_delay,
                             )
 
                         await asyncio.sleep(current_delay)
-                        current_delay *= current_backoff_factor
                     else:
-                        logger.error(f"All {retries} retry attempts failed.")
+                        logger.error("All %s retry attempts failed.", retries)
                         raise
 
             if last_exception:
@@ -1,6 +1,8 @@
 import os
+import sys
 from pathlib import Path
 import argparse
+import py_compile
 import re
 
 TEMPLATE_PATH = Path(__file__).parent.parent / 'parsers' / 'templates' / 'scraper_template.py'
@@ -9,6 +11,10 @@ IMPLEMENTATIONS_PATH = Path(__file__).parent.parent / 'parsers' / 'implementatio
 CLASS_TEMPLATE = 'ExampleShopScraper'
 CONFIG_TEMPLATE = 'ExampleShopConfig'
 
+# Template tokens, longest first so that 'ExampleShop' never shadows the class names
+_TEMPLATE_TOKENS = ('{description}', CLASS_TEMPLATE, CONFIG_TEMPLATE, 'example_shop', 'ExampleShop')
+_TOKEN_RE = re.compile('|'.join(map(re.escape, sorted(_TEMPLATE_TOKENS, key=len, reverse=True))))
+
 
 def generate_scraper(shop_name: str, description: str):
     """
@@ -17,34 +23,42 @@ def generate_scraper(shop_name: str, description: str):
         shop_name: Shop name (snake_case)
         description: Human-readable description
     """
-    class_name = f"{shop_name.capitalize()}Scraper"
-    config_class = f"{shop_name.capitalize()}Config"
+    capitalized = shop_name.capitalize()
+    class_name = capitalized + 'Scraper'
+    config_class = capitalized + 'Config'
     target_file = IMPLEMENTATIONS_PATH / f"{shop_name}_parser.py"
 
     if target_file.exists():
         raise FileExistsError(f"Scraper for '{shop_name}' already exists: {target_file}")
 
-    with open(TEMPLATE_PATH, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    content = content.replace('{description}', description)
-    content = content.replace(CLASS_TEMPLATE, class_name)
-    content = content.replace(CONFIG_TEMPLATE, config_class)
-    content = content.replace('example_shop', shop_name)
-    content = content.replace('ExampleShop', shop_name.capitalize())
-    content = re.sub(
-        r"@register_parser_decorator\(['\"]example_shop['\"], ['\"]\{description\}['\"]\)",
-        f"@register_parser_decorator('{shop_name}', '{description}')",
-        content
-    )
-    content = f'"""\n{description}\n"""\n' + content
-
-    with open(target_file, 'w', encoding='utf-8') as f:
-        f.write(content)
+    content = TEMPLATE_PATH.read_text(encoding='utf-8')
+
+    # Single pass over the template; the register decorator is covered by the tokens too
+    mapping = {
+        '{description}': description,
+        CLASS_TEMPLATE: class_name,
+        CONFIG_TEMPLATE: config_class,
+        'example_shop': shop_name,
+        'ExampleShop': capitalized,
+    }
+    content = _TOKEN_RE.sub(lambda match: mapping[match.group()], content)
+    target_file.write_text(f'"""\n{description}\n"""\n' + content, encoding='utf-8')
+    # Compile now so the first import loads cached bytecode (also surfaces syntax errors early)
+    try:
+        py_compile.compile(str(target_file), doraise=True)
+    except py_compile.PyCompileError:
+        # A broken module left behind would be picked up by the next import regeneration
+        target_file.unlink()
+        raise
     print(f"Scraper created: {target_file}")
+    # Register the new module in the static parser import list
+    from utils.parser_imports import regenerate_parser_imports
+    regenerate_parser_imports(IMPLEMENTATIONS_PATH)
 
 
 if __name__ == "__main__":
+    # Run as a script, only utils/ is on sys.path; add the project root for the utils package
+    sys.path.insert(0, str(Path(__file__).parent.parent))
     parser = argparse.ArgumentParser(description="Scraper generator")
     parser.add_argument("shop_name", type=str, help="Shop name (snake_case)")
     parser.add_argument("description", type=str, help="Human-readable description")